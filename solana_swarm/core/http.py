@@ -0,0 +1,84 @@
+"""
+Shared HTTP connection pool for Solana Swarm integrations.
+Reuses one keep-alive connector (DNS cache and pooled sockets) across clients in a process.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+import aiohttp
+from aiohttp.resolver import ThreadedResolver
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Solana-Agent-Studio/1.0",
+    "Accept": "application/json"
+}
+
+_SHARED_CONNECTOR: Optional[aiohttp.TCPConnector] = None
+_SHARED_CONNECTOR_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+# Open leases per connector; a connector is closed when its last lease is released
+_CONNECTOR_LEASES: Dict[aiohttp.TCPConnector, int] = {}
+
+
+def _create_connector() -> aiohttp.TCPConnector:
+    """Create a TCP connector tuned for repeated calls to a few API hosts."""
+    return aiohttp.TCPConnector(
+        resolver=ThreadedResolver(),
+        limit=100,
+        limit_per_host=30,
+        ttl_dns_cache=600,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True
+    )
+
+
+def _get_shared_connector() -> aiohttp.TCPConnector:
+    """Get the process-wide TCP connector, creating it on first use."""
+    global _SHARED_CONNECTOR, _SHARED_CONNECTOR_LOOP
+
+    loop = asyncio.get_running_loop()
+    if (
+        _SHARED_CONNECTOR is None
+        or _SHARED_CONNECTOR.closed
+        or _SHARED_CONNECTOR_LOOP is not loop
+    ):
+        _SHARED_CONNECTOR = _create_connector()
+        _SHARED_CONNECTOR_LOOP = loop
+        logger.info("Shared TCP connector created")
+
+    return _SHARED_CONNECTOR
+
+
+def acquire_shared_connector() -> aiohttp.TCPConnector:
+    """Lease the process-wide TCP connector.
+
+    Sessions built on it must pass connector_owner=False, and every lease
+    must be returned with release_shared_connector(); the connector is
+    closed once no client holds a lease on it.
+    """
+    connector = _get_shared_connector()
+    _CONNECTOR_LEASES[connector] = _CONNECTOR_LEASES.get(connector, 0) + 1
+    return connector
+
+
+async def release_shared_connector(connector: aiohttp.TCPConnector) -> None:
+    """Return a lease from acquire_shared_connector(), closing the connector after the last one."""
+    global _SHARED_CONNECTOR, _SHARED_CONNECTOR_LOOP
+
+    leases = _CONNECTOR_LEASES.get(connector, 0) - 1
+    if leases > 0:
+        _CONNECTOR_LEASES[connector] = leases
+        return
+
+    _CONNECTOR_LEASES.pop(connector, None)
+    if connector is _SHARED_CONNECTOR:
+        _SHARED_CONNECTOR = None
+        _SHARED_CONNECTOR_LOOP = None
+
+    if not connector.closed:
+        await connector.close()
+        logger.info("Shared TCP connector closed")
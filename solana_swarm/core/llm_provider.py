@@ -4,6 +4,8 @@ Uses OpenRouter API for diverse model access
 """
 
 import os
+import asyncio
+import weakref
 from typing import Dict, Any, Optional, List
 from abc import ABC, abstractmethod
 import logging
@@ -13,7 +15,21 @@ import aiohttp
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Default cap on in-flight LLM requests per process
+DEFAULT_MAX_CONCURRENT = int(os.getenv("LLM_MAX_CONCURRENT", "5"))
+
+# One semaphore per (event loop, limit), shared by every provider in the process
+_QUERY_SEMAPHORES = weakref.WeakKeyDictionary()
+
+def _get_query_semaphore(limit: int) -> asyncio.Semaphore:
+    """Get the process-wide semaphore bounding concurrent LLM requests."""
+    semaphores = _QUERY_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    semaphore = semaphores.get(limit)
+    if semaphore is None:
+        semaphore = semaphores[limit] = asyncio.Semaphore(limit)
+    return semaphore
+
+@dataclass(slots=True, frozen=True)
 class LLMConfig:
     """Configuration for LLM providers"""
     provider: str = "openrouter"
@@ -23,6 +39,7 @@ class LLMConfig:
     max_tokens: int = 2000
     api_url: str = "https://openrouter.ai/api/v1"
     system_prompt: Optional[str] = None
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT
 
     def validate(self) -> None:
         """Validate configuration"""
@@ -34,6 +51,8 @@ class LLMConfig:
             raise ValueError("Temperature must be between 0 and 1")
         if self.max_tokens < 1:
             raise ValueError("Max tokens must be positive")
+        if self.max_concurrent < 1:
+            raise ValueError("Max concurrent requests must be positive")
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
@@ -114,31 +133,34 @@ class OpenRouterProvider(LLMProvider):
                 "max_tokens": max_tokens or self.config.max_tokens
             }
             
-            async with self._session.post(
-                f"{self.config.api_url}/chat/completions",
-                json=data
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"API request failed: {response.status} - {error_text}")
-                
-                result = await response.json()
-                content = result["choices"][0]["message"]["content"]
-                
-                if expect_json:
-                    try:
-                        # Validate JSON
-                        json.loads(content)
-                        return content
-                    except json.JSONDecodeError:
-                        # Extract JSON from response if wrapped in text
-                        import re
-                        json_match = re.search(r'\\{.*\\}', content, re.DOTALL)
-                        if json_match:
-                            return json_match.group()
-                        raise ValueError("Expected JSON response but got invalid JSON")
-                
-                return content.strip()
+            # Bound in-flight requests across all agents sharing this process
+            async with _get_query_semaphore(self.config.max_concurrent):
+                async with self._session.post(
+                    f"{self.config.api_url}/chat/completions",
+                    json=data
+                ) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        raise Exception(f"API request failed: {response.status} - {error_text}")
+                    
+                    result = await response.json()
+            
+            content = result["choices"][0]["message"]["content"]
+            
+            if expect_json:
+                try:
+                    # Validate JSON
+                    json.loads(content)
+                    return content
+                except json.JSONDecodeError:
+                    # Extract JSON from response if wrapped in text
+                    import re
+                    json_match = re.search(r'\\{.*\\}', content, re.DOTALL)
+                    if json_match:
+                        return json_match.group()
+                    raise ValueError("Expected JSON response but got invalid JSON")
+            
+            return content.strip()
 
         except Exception as e:
             logger.error(f"Error querying OpenRouter API: {str(e)}")
@@ -152,11 +174,13 @@ class OpenRouterProvider(LLMProvider):
     ) -> List[str]:
         """Query with multiple prompts in parallel."""
         try:
-            results = []
-            for prompt in prompts:
-                result = await self.query(prompt, temperature=temperature, max_tokens=max_tokens)
-                results.append(result)
-            return results
+            # OpenRouter has no batch endpoint; fan out under the shared request limit
+            return list(await asyncio.gather(
+                *(
+                    self.query(prompt, temperature=temperature, max_tokens=max_tokens)
+                    for prompt in prompts
+                )
+            ))
         except Exception as e:
             logger.error(f"Error in batch query: {str(e)}")
             raise
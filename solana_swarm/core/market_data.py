@@ -17,6 +17,7 @@ import ccxt.async_support as ccxt
 from pycoingecko import CoinGeckoAPI
 
 from .exceptions import MarketDataError
+from .http import acquire_shared_connector, release_shared_connector
 from ..integrations.jupiter.client import JupiterClient
 
 logger = logging.getLogger(__name__)
@@ -107,12 +108,16 @@ class MarketDataManager:
     def __init__(self, 
                  jupiter_client: Optional[JupiterClient] = None,
                  coingecko_api_key: Optional[str] = None,
-                 enable_ccxt: bool = True):
+                 enable_ccxt: bool = True,
+                 connector: Optional[aiohttp.TCPConnector] = None):
         """Initialize market data manager."""
+        self._connector = connector
+        self._shared_connector: Optional[aiohttp.TCPConnector] = None
+        self._owns_jupiter_client = jupiter_client is None
         if jupiter_client is None:
             try:
                 from ..integrations.jupiter.client import JupiterClient
-                self.jupiter_client = JupiterClient()
+                self.jupiter_client = JupiterClient(connector=connector)
                 logger.info("Initialized Jupiter client")
             except Exception as e:
                 logger.warning(f"Failed to initialize Jupiter client: {e}")
@@ -132,6 +137,7 @@ class MarketDataManager:
         # Caching
         self.cache: Dict[str, tuple] = {}
         self.cache_ttl = 30  # 30 seconds for production
+        self._price_inflight: Dict[tuple, asyncio.Task] = {}
         
         # Rate limiting
         self.rate_limits = {
@@ -162,7 +168,17 @@ class MarketDataManager:
         """Ensure HTTP session exists."""
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=30.0)
+            
+            # Share DNS cache and keep-alive connections with the other clients
+            connector = self._connector
+            if connector is None:
+                if self._shared_connector is None:
+                    self._shared_connector = acquire_shared_connector()
+                connector = self._shared_connector
+            
             self.session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=False,
                 timeout=timeout,
                 headers={
                     "User-Agent": "Solana-Agent-Studio/1.0"
@@ -236,39 +252,78 @@ class MarketDataManager:
                 return cached_data.to_dict()
             return cached_data
         
+        # Coalesce concurrent cache misses for a symbol and source list into a single fetch
+        inflight_key = (symbol, tuple(sources) if sources is not None else None)
+        task = self._price_inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_token_price(symbol, cache_key, sources))
+            self._price_inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._price_inflight.pop(inflight_key, None))
+        
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _fetch_token_price(
+        self,
+        symbol: str,
+        cache_key: str,
+        sources: Optional[List[DataSource]] = None
+    ) -> Dict[str, Any]:
+        """Race price sources, cache the first usable price and cancel the rest."""
         # Determine sources to use
         if sources is None:
             sources = [DataSource.JUPITER, DataSource.COINGECKO, DataSource.BINANCE]
         
-        # Sort sources by priority
-        sources = sorted(sources, key=lambda s: self.source_priorities.get(s, 0), reverse=True)
-        
+        # Query every source at once so a slow source costs max latency, not the sum
+        tasks = {
+            asyncio.ensure_future(self._get_price_from_source(symbol, source)): source
+            for source in sources
+        }
+        pending = set(tasks)
         last_error = None
         
-        for source in sources:
-            try:
-                price_data = await self._get_price_from_source(symbol, source)
-                if price_data:
-                    # Convert PriceData to dict before caching
-                    price_dict = price_data.to_dict() if hasattr(price_data, 'to_dict') else {
-                        'symbol': symbol,
-                        'price': float(price_data.price),
-                        'volume_24h': float(price_data.volume_24h),
-                        'price_change_24h': price_data.change_24h,
-                        'market_cap': float(price_data.market_cap) if price_data.market_cap else None,
-                        'timestamp': price_data.timestamp.isoformat(),
-                        'source': price_data.source.value,
-                        'confidence': price_data.confidence
-                    }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                # Prefer higher-priority sources among those finishing together
+                for task in sorted(done, key=lambda t: self.source_priorities.get(tasks[t], 0), reverse=True):
+                    source = tasks[task]
+                    try:
+                        price_data = task.result()
+                    except Exception as e:
+                        last_error = e
+                        logger.warning(f"Failed to get price from {source.value}: {e}")
+                        continue
                     
-                    # Cache as dict
-                    self.cache[cache_key] = (price_dict, datetime.now())
-                    return price_dict
-            except Exception as e:
-                last_error = e
-                logger.warning(f"Failed to get price from {source.value}: {e}")
-                continue
-        
+                    if price_data:
+                        # Convert PriceData to dict before caching
+                        price_dict = price_data.to_dict() if hasattr(price_data, 'to_dict') else {
+                            'symbol': symbol,
+                            'price': float(price_data.price),
+                            'volume_24h': float(price_data.volume_24h),
+                            'price_change_24h': price_data.change_24h,
+                            'market_cap': float(price_data.market_cap) if price_data.market_cap else None,
+                            'timestamp': price_data.timestamp.isoformat(),
+                            'source': price_data.source.value,
+                            'confidence': price_data.confidence
+                        }
+                        
+                        # Cache as dict
+                        self.cache[cache_key] = (price_dict, datetime.now())
+                        return price_dict
+        finally:
+            # Cancel the losers (or everything, if the caller was cancelled)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            
+            # Retrieve failures we returned before inspecting, so none log as never retrieved
+            for task in tasks:
+                if not task.cancelled():
+                    task.exception()
+
         raise MarketDataError(f"All price sources failed for {symbol}. Last error: {last_error}")
 
 
@@ -347,8 +402,9 @@ class MarketDataManager:
             token_info = self.SOLANA_TOKENS[symbol]
             coin_id = token_info["coingecko_id"]
             
-            # Get coin data
-            data = self.coingecko.get_coin_by_id(
+            # pycoingecko is a blocking requests client; keep it off the event loop
+            data = await asyncio.to_thread(
+                self.coingecko.get_coin_by_id,
                 id=coin_id,
                 localization=False,
                 tickers=False,
@@ -661,6 +717,14 @@ class MarketDataManager:
             if self.session and not self.session.closed:
                 await self.session.close()
             
+            # Close the Jupiter client we created; a caller-supplied one is theirs
+            if self._owns_jupiter_client and self.jupiter_client:
+                await self.jupiter_client.close()
+            
+            if self._shared_connector is not None:
+                await release_shared_connector(self._shared_connector)
+                self._shared_connector = None
+            
             for exchange in self.exchanges.values():
                 await exchange.close()
             
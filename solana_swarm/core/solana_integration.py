@@ -6,9 +6,11 @@ This version is compatible with the latest solders library
 import asyncio
 import logging
 import time
-import json
+import os
 import base58
+import orjson
 from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
@@ -30,6 +32,13 @@ from solana_swarm.core.exceptions import SolanaError, ConfigError
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=8)
+def _load_keypair_file(wallet_path: str) -> Keypair:
+    """Load and cache a keypair from a Solana CLI JSON keypair file."""
+    with open(wallet_path, 'rb') as f:
+        secret_key = orjson.loads(f.read())
+    return Keypair.from_bytes(bytes(secret_key))
+
 @dataclass
 class SolanaConfig:
     """Production Solana configuration with validation."""
@@ -140,12 +149,9 @@ class SolanaConnection:
                 keypair_bytes = base58.b58decode(self.config.private_key)
                 self.keypair = Keypair.from_bytes(keypair_bytes)
             elif self.config.wallet_path:
-                # Load from file
-                import os
+                # Load from file (parsed once per path per process)
                 wallet_path = os.path.expanduser(self.config.wallet_path)
-                with open(wallet_path, 'r') as f:
-                    secret_key = json.load(f)
-                self.keypair = Keypair.from_bytes(bytes(secret_key))
+                self.keypair = _load_keypair_file(wallet_path)
             
             # Extract public key - FIXED
             self.pubkey = self.keypair.pubkey()
@@ -3,8 +3,11 @@ Fixed Swarm Agent Module
 Implements swarm intelligence for Solana agents with LLM-powered decision making
 """
 
+import asyncio
 import logging
 import json
+import numpy as np
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
@@ -14,13 +17,18 @@ from solana_swarm.plugins.base import AgentPlugin, PluginConfig
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Parsed LLM responses keyed by raw response text (bounded LRU)
+_PARSED_RESPONSES: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_PARSED_RESPONSES_MAX = 128
+
+@dataclass(slots=True, frozen=True)
 class SwarmConfig:
     """Swarm agent configuration."""
     role: str
     min_confidence: float = 0.7
     min_votes: int = 2
-    timeout: float = 1.0
+    # Per-peer vote budget; LLM-backed votes are full API round trips (None = no limit)
+    timeout: Optional[float] = 30.0
     max_retries: int = 3
     llm: Optional[LLMConfig] = None
 
@@ -32,7 +40,7 @@ class SwarmConfig:
             raise ValueError("min_confidence must be between 0 and 1")
         if self.min_votes < 1:
             raise ValueError("min_votes must be at least 1")
-        if self.timeout <= 0:
+        if self.timeout is not None and self.timeout <= 0:
             raise ValueError("timeout must be positive")
 
 class SwarmAgent(AgentPlugin):
@@ -53,7 +61,8 @@ class SwarmAgent(AgentPlugin):
         
         self.config = config
         self.llm = None
-        self.swarm_peers: List['SwarmAgent'] = []
+        # Insertion-ordered, keyed by agent for O(1) membership checks
+        self.swarm_peers: Dict['SwarmAgent', None] = {}
         self._is_running = False
         logger.info(f"Initialized swarm agent with role: {config.role}")
 
@@ -77,10 +86,10 @@ class SwarmAgent(AgentPlugin):
 
     async def join_swarm(self, peers: List['SwarmAgent']):
         """Join a swarm of agents."""
-        self.swarm_peers = peers
+        self.swarm_peers = dict.fromkeys(peers)
         for peer in peers:
-            if self not in peer.swarm_peers:
-                peer.swarm_peers.append(self)
+            # Idempotent O(1) back-link instead of a list scan per peer
+            peer.swarm_peers[self] = None
         logger.info(f"Joined swarm with {len(peers)} peers")
 
     async def propose_action(self, action_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -94,16 +103,37 @@ class SwarmAgent(AgentPlugin):
             "proposer": self.config.role
         }
 
-        # Collect votes from peers
+        # Collect votes from all peers concurrently, bounded by the vote timeout
+        peers = list(self.swarm_peers)
+        vote_timeout = self.config.timeout
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(peer.evaluate_proposal(proposal), vote_timeout)
+                for peer in peers
+            ),
+            return_exceptions=True
+        )
+
         votes = []
-        for peer in self.swarm_peers:
-            vote = await peer.evaluate_proposal(proposal)
+        for peer, vote in zip(peers, results):
+            if isinstance(vote, BaseException):
+                if isinstance(vote, asyncio.TimeoutError):
+                    reason = f"Vote timed out after {vote_timeout}s"
+                else:
+                    reason = f"Evaluation failed: {str(vote)}"
+                logger.warning(f"Peer {peer.config.role} did not vote: {reason}")
+                vote = {"decision": "reject", "confidence": 0.0, "reasoning": reason}
             votes.append(vote)
 
-        # Calculate consensus
+        # Calculate consensus from a boolean approval mask
         total_votes = len(votes)
-        positive_votes = sum(1 for v in votes if v["decision"] == "approve")
-        approval_rate = positive_votes / total_votes if total_votes > 0 else 0
+        approvals = np.fromiter(
+            (v["decision"] == "approve" for v in votes),
+            dtype=bool,
+            count=total_votes
+        )
+        positive_votes = int(approvals.sum())
+        approval_rate = float(approvals.mean()) if total_votes > 0 else 0
 
         # Check if consensus is reached
         consensus = (
@@ -264,6 +294,12 @@ Your primary responsibility is optimizing execution and performance."""
 
     def _parse_response(self, response: str) -> Dict[str, Any]:
         """Parse and validate LLM response."""
+        # Identical responses (repeated tool outputs, retries) are parsed once
+        cached = _PARSED_RESPONSES.get(response)
+        if cached is not None:
+            _PARSED_RESPONSES.move_to_end(response)
+            return dict(cached)
+
         try:
             result = json.loads(response)
             required_fields = ["observation", "reasoning", "conclusion", "confidence"]
@@ -280,7 +316,11 @@ Your primary responsibility is optimizing execution and performance."""
             if not isinstance(result["confidence"], (int, float)) or not 0 <= result["confidence"] <= 1:
                 result["confidence"] = 0.5
 
-            return result
+            _PARSED_RESPONSES[response] = result
+            if len(_PARSED_RESPONSES) > _PARSED_RESPONSES_MAX:
+                _PARSED_RESPONSES.popitem(last=False)
+
+            return dict(result)
 
         except json.JSONDecodeError:
             # If JSON parsing fails, create a basic response
@@ -334,7 +374,7 @@ Your primary responsibility is optimizing execution and performance."""
             
             self._initialized = False
             self._is_running = False
-            self.swarm_peers = []
+            self.swarm_peers = {}
             logger.info("SwarmAgent cleaned up")
             
         except Exception as e:
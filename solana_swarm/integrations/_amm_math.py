@@ -0,0 +1,31 @@
+"""
+AMM math kernels shared by the DEX integrations.
+
+Kept as plain integer functions so they are free of I/O and can be called
+directly from tight routing or arbitrage scans.
+"""
+
+from typing import Tuple
+
+
+def cpmm_out(
+    input_reserve: int,
+    output_reserve: int,
+    amount_in: int,
+    fee_bps: int
+) -> Tuple[int, int]:
+    """Constant-product swap output in raw token units.
+
+    Args:
+        input_reserve: Reserve of the token being sold
+        output_reserve: Reserve of the token being bought
+        amount_in: Amount sold, in raw token units
+        fee_bps: Swap fee in basis points, taken from the output
+
+    Returns:
+        Tuple of (amount_out after fee, fee)
+    """
+    # y * dx // (x + dx) floors the output; y - k // (x + dx) would round it up
+    amount_out_before_fee = output_reserve * amount_in // (input_reserve + amount_in)
+    fee = amount_out_before_fee * fee_bps // 10000
+    return amount_out_before_fee - fee, fee
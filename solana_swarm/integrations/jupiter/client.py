@@ -4,18 +4,24 @@ This version uses the correct lite-api.jup.ag endpoints
 """
 
 import logging
+import time
 import aiohttp
-from aiohttp.resolver import ThreadedResolver
+import orjson
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from decimal import Decimal
 from dataclasses import dataclass
 
 from .types import JupiterRoute, JupiterQuote
 from ...core.exceptions import JupiterError
+from ...core.http import acquire_shared_connector, release_shared_connector
 
 logger = logging.getLogger(__name__)
 
+def _orjson_dumps(obj: Any) -> str:
+    """Serialize request bodies with orjson (aiohttp expects a str)."""
+    return orjson.dumps(obj).decode()
+
 class JupiterClient:
     """Jupiter client with correct V2 API endpoints."""
     
@@ -24,24 +30,31 @@ class JupiterClient:
     TOKEN_API_URL = "https://lite-api.jup.ag/tokens/v2"  # FIXED: V2 API
     PRICE_API_URL = "https://lite-api.jup.ag/price/v3"   # FIXED: V3 price API
     
-    def __init__(self, solana_connection=None):
-        """Initialize Jupiter client."""
+    def __init__(self, solana_connection=None, connector: Optional[aiohttp.TCPConnector] = None):
+        """Initialize Jupiter client.
+        
+        Args:
+            solana_connection: Optional Solana connection used for swaps
+            connector: TCP connector to pool connections on; defaults to a
+                lease on the process-wide shared connector
+        """
         self.solana_connection = solana_connection
         self.session = None
+        self._connector = connector
+        self._shared_connector: Optional[aiohttp.TCPConnector] = None
         self._token_cache = None
-        self._cache_timestamp = 0
+        self._token_cache_expires = 0.0
         logger.info("Jupiter client initialized with V2/V3 API endpoints")
         
     async def _ensure_session(self):
         """Ensure HTTP session exists with proper SSL configuration."""
         if not self.session or self.session.closed:
-            connector = aiohttp.TCPConnector(
-                resolver=ThreadedResolver(),
-                ssl=True,
-                limit=100,
-                limit_per_host=30,
-                ttl_dns_cache=300
-            )
+            # Reuse DNS cache and keep-alive connections with the other clients
+            connector = self._connector
+            if connector is None:
+                if self._shared_connector is None:
+                    self._shared_connector = acquire_shared_connector()
+                connector = self._shared_connector
             
             timeout = aiohttp.ClientTimeout(
                 total=30,
@@ -51,7 +64,9 @@ class JupiterClient:
             
             self.session = aiohttp.ClientSession(
                 connector=connector,
+                connector_owner=False,
                 timeout=timeout,
+                json_serialize=_orjson_dumps,
                 headers={
                     "User-Agent": "Solana-Agent-Studio/1.0",
                     "Accept": "application/json",
@@ -66,11 +81,8 @@ class JupiterClient:
         
         FIXED: Now uses /tokens/v2/tag?query=verified endpoint
         """
-        import time
-        
-        # Check cache (5 minute TTL)
-        current_time = time.time()
-        if self._token_cache and (current_time - self._cache_timestamp) < 300:
+        # Check cache (5 minute TTL, monotonic deadline)
+        if self._token_cache and time.monotonic() < self._token_cache_expires:
             logger.info(f"Using cached token list ({len(self._token_cache)} tokens)")
             return self._token_cache
         
@@ -85,12 +97,13 @@ class JupiterClient:
                 
                 async with self.session.get(token_url) as response:
                     if response.status == 200:
-                        tokens = await response.json()
+                        # The verified list is large; parse the raw body with orjson
+                        tokens = orjson.loads(await response.read())
                         
                         if tokens and isinstance(tokens, list):
                             # Cache successful response
                             self._token_cache = tokens
-                            self._cache_timestamp = current_time
+                            self._token_cache_expires = time.monotonic() + 300
                             logger.info(f"✅ Loaded {len(tokens)} verified tokens from V2 API")
                             return tokens
                         else:
@@ -101,6 +114,8 @@ class JupiterClient:
                         
             except aiohttp.ClientError as e:
                 logger.warning(f"Network error fetching tokens (attempt {attempt + 1}): {e}")
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"Invalid token list response (attempt {attempt + 1}): {e}")
                 
             # Exponential backoff
             if attempt < max_retries - 1:
@@ -167,7 +182,7 @@ class JupiterClient:
                 
                 async with self.session.get(url, params=params) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = orjson.loads(await response.read())
                         return JupiterQuote.from_dict(data)
                     else:
                         error_text = await response.text()
@@ -186,9 +201,48 @@ class JupiterClient:
                     continue
                 else:
                     raise JupiterError(f"Network error: {e}")
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"Invalid quote response (attempt {attempt + 1}): {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                else:
+                    raise JupiterError(f"Invalid quote response: {e}")
         
         raise JupiterError("Quote failed after all retry attempts")
     
+    async def get_quotes_batch(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> List[Union[JupiterQuote, JupiterError]]:
+        """
+        Get quotes for several pairs concurrently over one keep-alive session.
+        
+        Each request is a dict with input_mint, output_mint, amount and an
+        optional slippage_bps. Results come back in request order; a failed
+        pair yields its JupiterError in place instead of failing the batch.
+        """
+        await self._ensure_session()
+        
+        results = await asyncio.gather(
+            *(
+                self.get_quote(
+                    req['input_mint'],
+                    req['output_mint'],
+                    req['amount'],
+                    req.get('slippage_bps', 50)
+                )
+                for req in requests
+            ),
+            return_exceptions=True
+        )
+        
+        return [
+            result if isinstance(result, (JupiterQuote, JupiterError))
+            else JupiterError(f"Quote failed: {result}")
+            for result in results
+        ]
+    
     async def get_price(
         self,
         input_mint: str,
@@ -377,6 +431,10 @@ class JupiterClient:
             # Give time for cleanup
             await asyncio.sleep(0.1)
             logger.info("Jupiter client session closed")
+        
+        if self._shared_connector is not None:
+            await release_shared_connector(self._shared_connector)
+            self._shared_connector = None
 
 
 # Test the fixed implementation
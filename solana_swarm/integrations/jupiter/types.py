@@ -4,8 +4,18 @@ Jupiter DEX aggregator type definitions.
 
 from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
+from operator import itemgetter
 
-@dataclass
+# Required route fields, fetched in one call per route
+_ROUTE_REQUIRED_FIELDS = itemgetter('inputMint', 'outputMint', 'inAmount', 'outAmount')
+
+# Required quote fields, fetched in one call per quote
+_QUOTE_REQUIRED_FIELDS = itemgetter(
+    'inputMint', 'inAmount', 'outputMint', 'outAmount', 'otherAmountThreshold',
+    'swapMode', 'slippageBps', 'priceImpactPct', 'routePlan', 'contextSlot', 'timeTaken'
+)
+
+@dataclass(slots=True, frozen=True)
 class JupiterRoute:
     """Jupiter swap route information."""
     input_mint: str
@@ -19,17 +29,19 @@ class JupiterRoute:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'JupiterRoute':
         """Create from API response data."""
+        input_mint, output_mint, amount_in, amount_out = _ROUTE_REQUIRED_FIELDS(data)
+        get = data.get
         return cls(
-            input_mint=data['inputMint'],
-            output_mint=data['outputMint'],
-            amount_in=int(data['inAmount']),
-            amount_out=int(data['outAmount']),
-            market_infos=data.get('routePlan', []),
-            price_impact_pct=float(data.get('priceImpactPct', 0)),
-            slippage_bps=data.get('slippageBps', 50)
+            input_mint=input_mint,
+            output_mint=output_mint,
+            amount_in=int(amount_in),
+            amount_out=int(amount_out),
+            market_infos=get('routePlan', []),
+            price_impact_pct=float(get('priceImpactPct', 0)),
+            slippage_bps=get('slippageBps', 50)
         )
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class JupiterQuote:
     """Jupiter swap quote."""
     input_mint: str
@@ -48,19 +60,22 @@ class JupiterQuote:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'JupiterQuote':
         """Create from API response data."""
+        (input_mint, in_amount, output_mint, out_amount, other_amount_threshold,
+         swap_mode, slippage_bps, price_impact_pct, route_plan, context_slot,
+         time_taken) = _QUOTE_REQUIRED_FIELDS(data)
         return cls(
-            input_mint=data['inputMint'],
-            in_amount=int(data['inAmount']),
-            output_mint=data['outputMint'],
-            out_amount=int(data['outAmount']),
-            other_amount_threshold=int(data['otherAmountThreshold']),
-            swap_mode=data['swapMode'],
-            slippage_bps=data['slippageBps'],
+            input_mint=input_mint,
+            in_amount=int(in_amount),
+            output_mint=output_mint,
+            out_amount=int(out_amount),
+            other_amount_threshold=int(other_amount_threshold),
+            swap_mode=swap_mode,
+            slippage_bps=slippage_bps,
             platform_fee=data.get('platformFee'),
-            price_impact_pct=data['priceImpactPct'],
-            route_plan=data['routePlan'],
-            context_slot=data['contextSlot'],
-            time_taken=data['timeTaken']
+            price_impact_pct=price_impact_pct,
+            route_plan=route_plan,
+            context_slot=context_slot,
+            time_taken=time_taken
         )
     
     def to_dict(self) -> Dict[str, Any]:
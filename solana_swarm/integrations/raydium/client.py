@@ -2,15 +2,22 @@
 Raydium DEX Client for liquidity pools and swapping.
 """
 
+import asyncio
 import logging
+import time
 import aiohttp
+import numpy as np
+import orjson
+from collections import defaultdict
 from typing import Dict, Any, List, Optional
 from decimal import Decimal
 from dataclasses import dataclass
-from solana.rpc.api import Pubkey
+from solders.pubkey import Pubkey
 
 from .types import RaydiumPool, RaydiumSwapParams
+from .._amm_math import cpmm_out
 from ...core.exceptions import DEXError, RaydiumError
+from ...core.http import DEFAULT_HEADERS, acquire_shared_connector, release_shared_connector
 
 logger = logging.getLogger(__name__)
 
@@ -18,56 +25,137 @@ class RaydiumClient:
     """Client for Raydium DEX operations."""
     
     BASE_URL = "https://api.raydium.io/v2"
-    PROGRAM_ID = PublicKey("675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8")
+    PROGRAM_ID = Pubkey.from_string("675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8")
+    POOLS_CACHE_TTL = 30.0
+    FEE_BPS = 25
     
-    def __init__(self, solana_connection=None):
-        """Initialize Raydium client."""
+    # Session-wide fallback for calls without their own budget (aiohttp defaults to 5 minutes)
+    SESSION_TIMEOUT = aiohttp.ClientTimeout(total=10)
+    
+    # Per-endpoint budgets: the full pair list is a large download, while a
+    # single pool lookup should come back fast or be retried
+    POOLS_TIMEOUT = aiohttp.ClientTimeout(total=30)
+    POOL_INFO_TIMEOUT = aiohttp.ClientTimeout(total=3)
+    POOL_INFO_RETRIES = 1
+    
+    def __init__(self, solana_connection=None, shared_session: bool = True):
+        """Initialize Raydium client.
+        
+        Args:
+            solana_connection: Optional Solana connection used for swaps
+            shared_session: Pool connections on the process-wide shared
+                connector instead of a private one
+        """
         self.solana_connection = solana_connection
         self.session = None
+        self._use_shared_connector = shared_session
+        self._shared_connector: Optional[aiohttp.TCPConnector] = None
         self._pools_cache = {}
-        self._cache_timestamp = 0
+        self._pools_cache_list: Optional[List[RaydiumPool]] = None
+        self._pools_by_mint: Dict[str, Dict[str, RaydiumPool]] = {}
+        self._pools_lock = asyncio.Lock()
+        self._cache_timestamp = 0.0
         
-    async def _ensure_session(self):
-        """Ensure HTTP session exists."""
-        if not self.session or self.session.closed:
+    def _session_ok(self) -> bool:
+        """Check if the current HTTP session is usable."""
+        return self.session is not None and not self.session.closed
+    
+    async def _create_session(self):
+        """Create the HTTP session, on the shared connector when enabled."""
+        if not self._use_shared_connector:
             self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30),
-                headers={
-                    "User-Agent": "Solana-Agent-Studio/1.0",
-                    "Accept": "application/json"
-                }
+                timeout=self.SESSION_TIMEOUT,
+                headers=DEFAULT_HEADERS
             )
+            return
+        
+        # Lease the connector once; the session is rebuilt on it as needed
+        if self._shared_connector is None:
+            self._shared_connector = acquire_shared_connector()
+        self.session = aiohttp.ClientSession(
+            connector=self._shared_connector,
+            connector_owner=False,
+            timeout=self.SESSION_TIMEOUT,
+            headers=DEFAULT_HEADERS
+        )
     
-    async def get_pools(self, mint_a: Optional[str] = None, mint_b: Optional[str] = None) -> List[RaydiumPool]:
-        """Get available liquidity pools."""
-        await self._ensure_session()
+    def _pools_list_fresh(self) -> bool:
+        """Check if the cached full pool list is still within its TTL."""
+        return (
+            self._pools_cache_list is not None and
+            time.monotonic() - self._cache_timestamp < self.POOLS_CACHE_TTL
+        )
+    
+    async def _get_all_pools(self) -> List[RaydiumPool]:
+        """Get the full pool list, refetching at most once per TTL."""
+        if self._pools_list_fresh():
+            return self._pools_cache_list
         
-        try:
+        async with self._pools_lock:
+            # Another caller may have refreshed the list while we waited
+            if self._pools_list_fresh():
+                return self._pools_cache_list
+            
+            if not self._session_ok():
+                await self._create_session()
             url = f"{self.BASE_URL}/main/pairs"
             
-            async with self.session.get(url) as response:
+            async with self.session.get(url, timeout=self.POOLS_TIMEOUT) as response:
                 if response.status != 200:
-                    error_text = await response.text()
                     raise RaydiumError(f"Failed to get pools: {response.status}")
                 
-                data = await response.json()
-                pools = []
-                
-                for pool_data in data:
-                    # Filter by mints if provided
-                    if mint_a and mint_b:
-                        pool_mints = [pool_data.get('baseMint'), pool_data.get('quoteMint')]
-                        if mint_a not in pool_mints or mint_b not in pool_mints:
-                            continue
-                    
-                    pool = RaydiumPool.from_dict(pool_data)
-                    pools.append(pool)
-                    
-                    # Cache pool data
-                    self._pools_cache[pool.id] = pool
-                
-                return pools
-                
+                # Parse the large pairs payload directly from the raw body
+                data = orjson.loads(await response.read())
+            
+            # One malformed row should not fail the whole pool list
+            pools = []
+            skipped = 0
+            for pool_data in data:
+                try:
+                    pools.append(RaydiumPool.from_dict(pool_data))
+                except Exception as e:
+                    skipped += 1
+                    logger.debug(f"Skipping malformed Raydium pool: {e}")
+            
+            if skipped:
+                logger.warning(f"Skipped {skipped} malformed Raydium pools")
+            
+            # Index pools by mint so pair lookups avoid scanning the full list
+            pools_by_mint: Dict[str, Dict[str, RaydiumPool]] = defaultdict(dict)
+            for pool in pools:
+                pools_by_mint[pool.base_mint][pool.id] = pool
+                pools_by_mint[pool.quote_mint][pool.id] = pool
+            
+            # Cache pool data
+            self._pools_cache.update((pool.id, pool) for pool in pools)
+            self._pools_cache_list = pools
+            self._pools_by_mint = dict(pools_by_mint)
+            self._cache_timestamp = time.monotonic()
+            
+            return pools
+    
+    def _pools_for_pair(self, mint_a: str, mint_b: str) -> List[RaydiumPool]:
+        """Look up pools trading both mints via the per-mint index."""
+        pools_a = self._pools_by_mint.get(mint_a, {})
+        pools_b = self._pools_by_mint.get(mint_b, {})
+        
+        # Walk the smaller side so the cost is bounded by the match count
+        if len(pools_b) < len(pools_a):
+            pools_a, pools_b = pools_b, pools_a
+        
+        return [pool for pool_id, pool in pools_a.items() if pool_id in pools_b]
+    
+    async def get_pools(self, mint_a: Optional[str] = None, mint_b: Optional[str] = None) -> List[RaydiumPool]:
+        """Get available liquidity pools."""
+        try:
+            pools = await self._get_all_pools()
+            
+            # Filter by mints if provided
+            if mint_a and mint_b:
+                return self._pools_for_pair(mint_a, mint_b)
+            
+            return list(pools)
+            
         except Exception as e:
             logger.error(f"Failed to get Raydium pools: {e}")
             raise RaydiumError(f"Pools fetch failed: {e}")
@@ -78,27 +166,84 @@ class RaydiumClient:
         if pool_id in self._pools_cache:
             return self._pools_cache[pool_id]
         
-        await self._ensure_session()
+        if not self._session_ok():
+            await self._create_session()
         
         try:
             url = f"{self.BASE_URL}/main/pool/{pool_id}"
             
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    raise RaydiumError(f"Failed to get pool info: {response.status}")
-                
-                data = await response.json()
-                pool = RaydiumPool.from_dict(data)
-                
-                # Cache the pool
-                self._pools_cache[pool_id] = pool
-                
-                return pool
-                
+            for attempt in range(self.POOL_INFO_RETRIES + 1):
+                try:
+                    async with self.session.get(url, timeout=self.POOL_INFO_TIMEOUT) as response:
+                        if response.status != 200:
+                            raise RaydiumError(f"Failed to get pool info: {response.status}")
+                        
+                        data = await response.json(loads=orjson.loads)
+                        break
+                        
+                except asyncio.TimeoutError:
+                    if attempt == self.POOL_INFO_RETRIES:
+                        raise
+                    logger.warning(f"Pool info timed out for {pool_id} (attempt {attempt + 1})")
+                    await asyncio.sleep(0.1 * 2 ** attempt)
+            
+            pool = RaydiumPool.from_dict(data)
+            
+            # Cache the pool
+            self._pools_cache[pool_id] = pool
+            
+            return pool
+            
         except Exception as e:
             logger.error(f"Failed to get pool info for {pool_id}: {e}")
             raise RaydiumError(f"Pool info fetch failed: {e}")
     
+    def _quote_pool(
+        self,
+        pool: RaydiumPool,
+        input_mint: str,
+        amount_in: int,
+        slippage_bps: int
+    ) -> Dict[str, Any]:
+        """Quote a swap against a pool snapshot without any I/O."""
+        # Determine direction: 1 when selling base for quote, 0 otherwise
+        direction = int(input_mint == pool.base_mint)
+        
+        # Get reserves by index instead of branching
+        reserves = (pool.quote_reserve, pool.base_reserve)
+        input_reserve = reserves[direction]
+        output_reserve = reserves[1 - direction]
+        
+        # Calculate output using constant product formula
+        # x * y = k
+        # (x + dx) * (y - dy) = k
+        # dy = y * dx / (x + dx)
+        # Integer math floors to whole token units, like the on-chain program
+        # Fee (0.25%) is taken from the output
+        amount_out, fee = cpmm_out(
+            input_reserve, output_reserve, amount_in, self.FEE_BPS
+        )
+        
+        # Apply slippage
+        min_amount_out = amount_out * (10000 - slippage_bps) // 10000
+        
+        # Calculate price impact in basis points with integer mul-div:
+        # |after/before - 1| = |(y - dy) * x - y * (x + dx)| / (y * (x + dx))
+        denom = output_reserve * (input_reserve + amount_in)
+        numer = abs(denom - (output_reserve - amount_out) * input_reserve)
+        price_impact_bps = numer * 10000 // denom
+        
+        return {
+            "pool_id": pool.id,
+            "amount_in": amount_in,
+            "amount_out": amount_out,
+            "min_amount_out": min_amount_out,
+            "price_impact": price_impact_bps / 100.0,
+            "price_impact_bps": price_impact_bps,
+            "fee": fee,
+            "route": [pool.id]
+        }
+    
     async def calculate_swap(
         self,
         pool_id: str,
@@ -110,56 +255,69 @@ class RaydiumClient:
         """Calculate swap output amount."""
         try:
             pool = await self.get_pool_info(pool_id)
+            return self._quote_pool(pool, input_mint, amount_in, slippage_bps)
             
-            # Determine direction
-            is_base_to_quote = (input_mint == pool.base_mint)
-            
-            # Get reserves
-            if is_base_to_quote:
-                input_reserve = pool.base_reserve
-                output_reserve = pool.quote_reserve
-            else:
-                input_reserve = pool.quote_reserve
-                output_reserve = pool.base_reserve
-            
-            # Calculate output using constant product formula
-            # x * y = k
-            # (x + dx) * (y - dy) = k
-            # dy = y - k/(x + dx)
-            
-            k = input_reserve * output_reserve
-            amount_out_before_fee = output_reserve - (k / (input_reserve + amount_in))
+        except Exception as e:
+            logger.error(f"Failed to calculate swap: {e}")
+            raise RaydiumError(f"Swap calculation failed: {e}")
+    
+    async def get_quote(
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount_in: int,
+        slippage_bps: int = 50,
+        good_enough_out: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get the best swap quote across all pools for a token pair.
+        
+        Args:
+            input_mint: Mint of the token being sold
+            output_mint: Mint of the token being bought
+            amount_in: Amount sold, in raw token units
+            slippage_bps: Slippage tolerance in basis points
+            good_enough_out: Return the first quote with at least this output
+                instead of checking every pool
+        """
+        try:
+            # One (cached) list fetch returns full pool snapshots, so every
+            # candidate is quoted locally with no further round-trips
+            pools = await self.get_pools(input_mint, output_mint)
             
-            # Apply fee (0.25%)
-            fee_rate = 0.0025
-            amount_out = amount_out_before_fee * (1 - fee_rate)
+            if not pools:
+                raise RaydiumError(f"No pools found for {input_mint}/{output_mint}")
             
-            # Apply slippage
-            min_amount_out = int(amount_out * (1 - slippage_bps / 10000))
+            # Keep a running best so losing quotes are dropped immediately
+            best = None
+            best_out = -1
+            for pool in pools:
+                try:
+                    quote = self._quote_pool(pool, input_mint, amount_in, slippage_bps)
+                except Exception as e:
+                    logger.warning(f"Quote failed for pool {pool.id}: {e}")
+                    continue
+                
+                if quote['amount_out'] <= best_out:
+                    continue
+                
+                best = quote
+                best_out = quote['amount_out']
+                if good_enough_out is not None and best_out >= good_enough_out:
+                    break
             
-            # Calculate price impact
-            price_before = output_reserve / input_reserve
-            price_after = (output_reserve - amount_out) / (input_reserve + amount_in)
-            price_impact = abs((price_after - price_before) / price_before) * 100
+            if best is None:
+                raise RaydiumError(f"No quotes available for {input_mint}/{output_mint}")
             
-            return {
-                "pool_id": pool_id,
-                "amount_in": amount_in,
-                "amount_out": int(amount_out),
-                "min_amount_out": min_amount_out,
-                "price_impact": price_impact,
-                "fee": int(amount_out_before_fee * fee_rate),
-                "route": [pool_id]
-            }
+            return best
             
         except Exception as e:
-            logger.error(f"Failed to calculate swap: {e}")
-            raise RaydiumError(f"Swap calculation failed: {e}")
+            logger.error(f"Failed to get Raydium quote: {e}")
+            raise RaydiumError(f"Quote failed: {e}")
     
     async def swap(
         self,
         params: RaydiumSwapParams,
-        user_public_key: PublicKey
+        user_public_key: Pubkey
     ) -> Dict[str, Any]:
         """Execute token swap on Raydium."""
         try:
@@ -204,16 +362,15 @@ class RaydiumClient:
                 raise RaydiumError(f"No pools found for {input_mint}/{output_mint}")
             
             # Use the pool with highest liquidity
-            best_pool = max(pools, key=lambda p: p.liquidity)
+            liquidities = np.fromiter(
+                (p.liquidity for p in pools),
+                dtype=np.float64,
+                count=len(pools)
+            )
+            best_pool = pools[int(liquidities.argmax())]
             
             # Calculate price
-            calc_result = await self.calculate_swap(
-                best_pool.id,
-                input_mint,
-                output_mint,
-                amount,
-                50
-            )
+            calc_result = self._quote_pool(best_pool, input_mint, amount, 50)
             
             price = calc_result['amount_out'] / amount
             
@@ -222,7 +379,7 @@ class RaydiumClient:
                 "input_mint": input_mint,
                 "output_mint": output_mint,
                 "pool_id": best_pool.id,
-                "liquidity": float(best_pool.liquidity)
+                "liquidity": best_pool.liquidity
             }
             
         except Exception as e:
@@ -235,11 +392,11 @@ class RaydiumClient:
             pool = await self.get_pool_info(pool_id)
             
             # Calculate various metrics
-            total_liquidity = float(pool.liquidity)
-            base_price = float(pool.quote_reserve / pool.base_reserve if pool.base_reserve > 0 else 0)
+            total_liquidity = pool.liquidity
+            base_price = pool.base_price
             
             # Calculate 24h APR (simplified)
-            volume_24h = float(pool.volume_24h)
+            volume_24h = pool.volume_24h
             fees_24h = volume_24h * 0.0025  # 0.25% fee
             apr_24h = (fees_24h * 365 / total_liquidity * 100) if total_liquidity > 0 else 0
             
@@ -259,6 +416,11 @@ class RaydiumClient:
             raise RaydiumError(f"Stats fetch failed: {e}")
     
     async def close(self):
-        """Close HTTP session."""
+        """Close the HTTP session and return the shared connector lease."""
         if self.session and not self.session.closed:
-            await self.session.close()
\ No newline at end of file
+            await self.session.close()
+        self.session = None
+        
+        if self._shared_connector is not None:
+            await release_shared_connector(self._shared_connector)
+            self._shared_connector = None
\ No newline at end of file
@@ -2,11 +2,26 @@
 Raydium DEX type definitions.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from decimal import Decimal
+from operator import itemgetter
 
-@dataclass
+# Required pool fields, fetched in one call per pool
+_POOL_REQUIRED_FIELDS = itemgetter(
+    'id', 'baseMint', 'quoteMint', 'lpMint',
+    'baseDecimals', 'quoteDecimals', 'lpDecimals'
+)
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a JSON number to Decimal without binary float artifacts."""
+    return Decimal(str(value))
+
+def _to_raw_units(value: Any) -> int:
+    """Convert a JSON reserve (int, float or decimal string) to whole raw units."""
+    return int(_to_decimal(value))
+
+@dataclass(slots=True, frozen=True)
 class RaydiumPool:
     """Raydium liquidity pool information."""
     id: str
@@ -18,35 +33,56 @@ class RaydiumPool:
     lp_decimal: int
     version: int
     program_id: str
-    base_reserve: Decimal
-    quote_reserve: Decimal
+    base_reserve: int
+    quote_reserve: int
     lp_supply: Decimal
-    liquidity: Decimal
-    volume_24h: Decimal
+    liquidity: float
+    volume_24h: float
     fee_rate: float
     
+    # Spot price derived from the reserves, computed once per pool snapshot
+    _base_price: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompute the spot price."""
+        object.__setattr__(
+            self, '_base_price',
+            self.quote_reserve / self.base_reserve if self.base_reserve > 0 else 0.0
+        )
+    
+    @property
+    def base_price(self) -> float:
+        """Spot price of the base token in quote token raw units."""
+        return self._base_price
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'RaydiumPool':
         """Create from API response data."""
+        pool_id, base_mint, quote_mint, lp_mint, base_decimal, quote_decimal, lp_decimal = (
+            _POOL_REQUIRED_FIELDS(data)
+        )
+        get = data.get
         return cls(
-            id=data['id'],
-            base_mint=data['baseMint'],
-            quote_mint=data['quoteMint'],
-            lp_mint=data['lpMint'],
-            base_decimal=data['baseDecimals'],
-            quote_decimal=data['quoteDecimals'],
-            lp_decimal=data['lpDecimals'],
-            version=data.get('version', 4),
-            program_id=data.get('programId', ''),
-            base_reserve=Decimal(str(data.get('baseReserve', 0))),
-            quote_reserve=Decimal(str(data.get('quoteReserve', 0))),
-            lp_supply=Decimal(str(data.get('lpSupply', 0))),
-            liquidity=Decimal(str(data.get('liquidity', 0))),
-            volume_24h=Decimal(str(data.get('volume24h', 0))),
-            fee_rate=float(data.get('feeRate', 0.0025))
+            id=pool_id,
+            base_mint=base_mint,
+            quote_mint=quote_mint,
+            lp_mint=lp_mint,
+            base_decimal=base_decimal,
+            quote_decimal=quote_decimal,
+            lp_decimal=lp_decimal,
+            version=get('version', 4),
+            program_id=get('programId', ''),
+            # Reserves are raw token units, kept as int for exact CPMM math
+            base_reserve=_to_raw_units(get('baseReserve', 0)),
+            quote_reserve=_to_raw_units(get('quoteReserve', 0)),
+            lp_supply=_to_decimal(get('lpSupply', 0)),
+            # USD metrics are only ever read as floats
+            liquidity=float(get('liquidity', 0)),
+            volume_24h=float(get('volume24h', 0)),
+            fee_rate=float(get('feeRate', 0.0025))
         )
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RaydiumSwapParams:
     """Parameters for Raydium swap."""
     pool_id: str
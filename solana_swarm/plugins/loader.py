@@ -6,6 +6,7 @@ Manages plugin lifecycle and integration with SwarmAgent
 import os
 import logging
 import importlib
+from importlib.metadata import entry_points, EntryPoint
 from typing import Dict, Any, Optional, Type, List
 import yaml
 
@@ -14,9 +15,16 @@ from .base import AgentPlugin, PluginConfig
 
 logger = logging.getLogger(__name__)
 
+# Entry point group third-party packages use to register plugins
+ENTRY_POINT_GROUP = "solana_swarm.plugins"
+
 class PluginLoader:
     """Manages plugin loading and lifecycle"""
     
+    # Resolved plugin classes by name, shared by every loader in the process
+    _registry: Dict[str, Type[AgentPlugin]] = {}
+    _entry_points: Optional[Dict[str, EntryPoint]] = None
+    
     def __init__(self):
         self._loaded_plugins: Dict[str, AgentPlugin] = {}
         
@@ -72,32 +80,8 @@ class PluginLoader:
             if name in self._loaded_plugins:
                 return self._loaded_plugins[name]
             
-            # Import plugin module
-            module = None
-            
-            # Try loading from plugins directory first
-            plugin_path = os.path.join("plugins", name, "plugin.py")
-            if os.path.exists(plugin_path):
-                spec = importlib.util.spec_from_file_location(name, plugin_path)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-            
-            # If not found, try other locations
-            if not module:
-                try:
-                    module_path = f"solana_swarm.plugins.{name}"
-                    module = importlib.import_module(module_path)
-                except ImportError:
-                    # Try loading from agents directory
-                    agent_path = os.path.join("solana_swarm", "agents", name, "plugin.py")
-                    if os.path.exists(agent_path):
-                        spec = importlib.util.spec_from_file_location(name, agent_path)
-                        if spec and spec.loader:
-                            module = importlib.util.module_from_spec(spec)
-                            spec.loader.exec_module(module)
-                    else:
-                        raise ImportError(f"Agent/plugin not found: {name}")
+            # Resolve plugin class (cached after the first import)
+            plugin_class = self._resolve_plugin_class(name)
                 
             # Load configuration
             if not plugin_config:
@@ -136,16 +120,6 @@ class PluginLoader:
                 )
                 
             # Create plugin instance
-            plugin_class = None
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if isinstance(attr, type) and issubclass(attr, AgentPlugin) and attr != AgentPlugin:
-                    plugin_class = attr
-                    break
-                    
-            if not plugin_class:
-                raise ImportError(f"No agent/plugin class found in module: {name}")
-                
             plugin = plugin_class(agent_config, plugin_config)
             
             # Initialize plugin
@@ -161,6 +135,66 @@ class PluginLoader:
             logger.error(f"Error loading {name}: {str(e)}")
             raise
             
+    @classmethod
+    def _resolve_plugin_class(cls, name: str) -> Type[AgentPlugin]:
+        """Resolve a plugin class by name, importing its module at most once"""
+        # Check registry first
+        plugin_class = cls._registry.get(name)
+        if plugin_class is not None:
+            return plugin_class
+        
+        # Installed packages can register plugins without a file scan
+        if cls._entry_points is None:
+            cls._entry_points = {
+                ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)
+            }
+        
+        entry_point = cls._entry_points.get(name)
+        if entry_point is not None:
+            plugin_class = entry_point.load()
+            cls._registry[name] = plugin_class
+            return plugin_class
+        
+        # Import plugin module
+        module = None
+        
+        # Try loading from plugins directory first
+        plugin_path = os.path.join("plugins", name, "plugin.py")
+        if os.path.exists(plugin_path):
+            spec = importlib.util.spec_from_file_location(name, plugin_path)
+            if spec and spec.loader:
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+        
+        # If not found, try other locations
+        if not module:
+            try:
+                module_path = f"solana_swarm.plugins.{name}"
+                module = importlib.import_module(module_path)
+            except ImportError:
+                # Try loading from agents directory
+                agent_path = os.path.join("solana_swarm", "agents", name, "plugin.py")
+                if os.path.exists(agent_path):
+                    spec = importlib.util.spec_from_file_location(name, agent_path)
+                    if spec and spec.loader:
+                        module = importlib.util.module_from_spec(spec)
+                        spec.loader.exec_module(module)
+                else:
+                    raise ImportError(f"Agent/plugin not found: {name}")
+            
+        # Find plugin class in module
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if isinstance(attr, type) and issubclass(attr, AgentPlugin) and attr != AgentPlugin:
+                plugin_class = attr
+                break
+                
+        if not plugin_class:
+            raise ImportError(f"No agent/plugin class found in module: {name}")
+        
+        cls._registry[name] = plugin_class
+        return plugin_class
+            
     async def unload_plugin(self, name: str) -> None:
         """Unload and cleanup a plugin"""
         if name in self._loaded_plugins:
@@ -0,0 +1,14 @@
+"""
+Shared fixtures for the Solana Swarm test suite
+"""
+
+import pytest
+
+from solana_swarm.plugins.loader import PluginLoader
+
+
+@pytest.fixture(autouse=True)
+def reset_plugin_registry(monkeypatch):
+    """Give every test a fresh process-wide plugin registry and entry point scan."""
+    monkeypatch.setattr(PluginLoader, "_registry", {})
+    monkeypatch.setattr(PluginLoader, "_entry_points", None)
@@ -0,0 +1,62 @@
+"""
+Tests for the shared HTTP connector lifecycle
+"""
+
+import pytest
+
+from solana_swarm.core import http
+from solana_swarm.integrations.jupiter.client import JupiterClient
+from solana_swarm.integrations.raydium import RaydiumClient
+
+
+@pytest.mark.asyncio
+async def test_shared_connector_closed_with_last_client():
+    """Test the shared connector stays open until its last client closes."""
+    first, second = RaydiumClient(), RaydiumClient()
+    await first._create_session()
+    await second._create_session()
+
+    connector = first.session.connector
+    assert second.session.connector is connector
+
+    # Closing one client (even twice) leaves the other one's pool alone
+    await first.close()
+    await first.close()
+    assert not connector.closed
+    assert not second.session.closed
+
+    await second.close()
+    assert connector.closed
+    assert connector not in http._CONNECTOR_LEASES
+
+
+@pytest.mark.asyncio
+async def test_client_reopened_after_close_gets_new_connector():
+    """Test a closed client can reopen on a fresh shared connector."""
+    client = RaydiumClient()
+    await client._create_session()
+    old_connector = client.session.connector
+    await client.close()
+
+    await client._create_session()
+    try:
+        assert client.session.connector is not old_connector
+        assert not client.session.connector.closed
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_dex_clients_share_one_connector():
+    """Test Jupiter and Raydium pool on one connector owned by their leases."""
+    jupiter, raydium = JupiterClient(), RaydiumClient()
+    await jupiter._ensure_session()
+    await raydium._create_session()
+
+    connector = jupiter.session.connector
+    assert raydium.session.connector is connector
+    assert http._CONNECTOR_LEASES[connector] == 2
+
+    await jupiter.close()
+    await raydium.close()
+    assert connector.closed
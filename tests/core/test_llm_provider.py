@@ -0,0 +1,74 @@
+"""
+Tests for LLM provider request handling
+"""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from solana_swarm.core.llm_provider import LLMConfig, OpenRouterProvider
+
+
+class _TrackingResponse:
+    """Fake chat completion response that records overlapping requests."""
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.status = 200
+
+    async def __aenter__(self):
+        self.tracker["active"] += 1
+        self.tracker["peak"] = max(self.tracker["peak"], self.tracker["active"])
+        await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.tracker["active"] -= 1
+        return None
+
+    async def json(self):
+        return {"choices": [{"message": {"content": "ok"}}]}
+
+
+@pytest.mark.asyncio
+async def test_query_respects_max_concurrent():
+    """Test concurrent queries are serialized by the max_concurrent limit."""
+    config = LLMConfig(api_key="test_key", model="test_model", max_concurrent=1)
+    provider = OpenRouterProvider(config)
+
+    tracker = {"active": 0, "peak": 0}
+    session = MagicMock()
+    session.closed = False
+    session.post.side_effect = lambda *args, **kwargs: _TrackingResponse(tracker)
+    provider._session = session
+
+    results = await asyncio.gather(*(provider.query(f"prompt {i}") for i in range(3)))
+
+    assert results == ["ok", "ok", "ok"]
+    assert session.post.call_count == 3
+    assert tracker["peak"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_query_runs_prompts_concurrently():
+    """Test batch_query overlaps requests up to max_concurrent and keeps order."""
+    config = LLMConfig(api_key="test_key", model="test_model", max_concurrent=3)
+    provider = OpenRouterProvider(config)
+
+    tracker = {"active": 0, "peak": 0}
+    session = MagicMock()
+    session.closed = False
+    session.post.side_effect = lambda *args, **kwargs: _TrackingResponse(tracker)
+    provider._session = session
+
+    results = await provider.batch_query([f"prompt {i}" for i in range(3)])
+
+    assert results == ["ok", "ok", "ok"]
+    assert session.post.call_count == 3
+    assert tracker["peak"] == 3
+
+
+def test_llm_config_validation():
+    """Test LLMConfig rejects a non-positive concurrency limit."""
+    with pytest.raises(ValueError):
+        LLMConfig(api_key="test_key", model="test_model", max_concurrent=0).validate()
@@ -0,0 +1,63 @@
+"""
+Tests for plugin class resolution in PluginLoader
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from solana_swarm.plugins.base import AgentPlugin
+from solana_swarm.plugins.loader import PluginLoader, ENTRY_POINT_GROUP
+
+
+class RegisteredPlugin(AgentPlugin):
+    """Plugin exposed through the solana_swarm.plugins entry point group."""
+
+    async def initialize(self):
+        self._is_initialized = True
+
+    async def evaluate(self, context):
+        return {"result": "registered"}
+
+    async def execute(self, operation=None, **kwargs):
+        return {"status": "success"}
+
+    async def cleanup(self):
+        self._is_initialized = False
+
+
+@pytest.mark.asyncio
+async def test_entry_point_plugin_resolved_once():
+    """Test entry point plugins are imported once and shared across loaders."""
+    entry_point = MagicMock()
+    entry_point.name = "registered-plugin"
+    entry_point.load.return_value = RegisteredPlugin
+
+    with patch(
+        "solana_swarm.plugins.loader.entry_points",
+        return_value=[entry_point]
+    ) as mock_entry_points:
+        first, second = PluginLoader(), PluginLoader()
+        try:
+            plugin_a = await first.load_plugin("registered-plugin")
+            plugin_b = await second.load_plugin("registered-plugin")
+        finally:
+            await first.cleanup()
+            await second.cleanup()
+
+    assert isinstance(plugin_a, RegisteredPlugin)
+    assert isinstance(plugin_b, RegisteredPlugin)
+    assert plugin_a is not plugin_b
+    mock_entry_points.assert_called_once_with(group=ENTRY_POINT_GROUP)
+    entry_point.load.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_unknown_plugin_raises():
+    """Test a plugin found neither in entry points nor on disk is an ImportError."""
+    loader = PluginLoader()
+
+    with patch("solana_swarm.plugins.loader.entry_points", return_value=[]):
+        with pytest.raises(ImportError):
+            await loader.load_plugin("no-such-plugin-anywhere")
+
+    assert "no-such-plugin-anywhere" not in PluginLoader._registry
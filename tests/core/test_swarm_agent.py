@@ -2,16 +2,18 @@
 Tests for SwarmAgent core functionality
 """
 
+import asyncio
 import pytest
+from contextlib import ExitStack
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from solana_swarm.core.swarm_agent import SwarmAgent, SwarmConfig
 from solana_swarm.core.llm_provider import LLMConfig
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def swarm_config():
-    """Create test swarm configuration."""
+    """Create test swarm configuration (frozen, so safe to share)."""
     return SwarmConfig(
         role="test_agent",
         min_confidence=0.7,
@@ -57,9 +59,7 @@ async def test_swarm_agent_join_swarm():
     agent2 = SwarmAgent(config2)
     agent3 = SwarmAgent(config3)
     
-    await agent1.initialize()
-    await agent2.initialize()
-    await agent3.initialize()
+    await asyncio.gather(agent1.initialize(), agent2.initialize(), agent3.initialize())
     
     # Agent1 joins with agent2 and agent3
     await agent1.join_swarm([agent2, agent3])
@@ -106,11 +106,8 @@ async def test_propose_action_consensus():
         SwarmConfig(role="decision_maker", min_confidence=0.75)
     ]
     
-    agents = []
-    for config in configs:
-        agent = SwarmAgent(config)
-        await agent.initialize()
-        agents.append(agent)
+    agents = [SwarmAgent(config) for config in configs]
+    await asyncio.gather(*(agent.initialize() for agent in agents))
     
     # Form swarm
     await agents[0].join_swarm(agents[1:])
@@ -122,10 +119,6 @@ async def test_propose_action_consensus():
         {"decision": "approve", "confidence": 0.9, "reasoning": "Optimal strategy"}
     ]
     
-    for i, agent in enumerate(agents):
-        with patch.object(agent, 'evaluate_proposal') as mock_eval:
-            mock_eval.return_value = mock_votes[i]
-    
     # Propose action
     proposal_params = {
         "token_pair": "SOL/USDC",
@@ -133,7 +126,14 @@ async def test_propose_action_consensus():
         "direction": "buy"
     }
     
-    result = await agents[0].propose_action("trade", proposal_params)
+    # Keep every agent patched for the duration of the proposal
+    with ExitStack() as stack:
+        for agent, vote in zip(agents, mock_votes):
+            stack.enter_context(
+                patch.object(agent, 'evaluate_proposal', return_value=vote)
+            )
+        
+        result = await agents[0].propose_action("trade", proposal_params)
     
     assert result["consensus"] is True
     assert result["approval_rate"] >= 0.8
@@ -149,11 +149,8 @@ async def test_propose_action_no_consensus():
         SwarmConfig(role="agent2", min_confidence=0.8)
     ]
     
-    agents = []
-    for config in configs:
-        agent = SwarmAgent(config)
-        await agent.initialize()
-        agents.append(agent)
+    agents = [SwarmAgent(config) for config in configs]
+    await asyncio.gather(*(agent.initialize() for agent in agents))
     
     await agents[0].join_swarm([agents[1]])
     
@@ -162,13 +159,36 @@ async def test_propose_action_no_consensus():
         {"decision": "reject", "confidence": 0.9, "reasoning": "High risk"},
     ]
     
-    with patch.object(agents[1], 'evaluate_proposal') as mock_eval:
-        mock_eval.return_value = mock_votes[0]
-    
-    result = await agents[0].propose_action("trade", {"amount": 1000})
+    # Keep the peer patched for the duration of the proposal
+    with patch.object(agents[1], 'evaluate_proposal', return_value=mock_votes[0]) as mock_eval:
+        result = await agents[0].propose_action("trade", {"amount": 1000})
     
+    mock_eval.assert_awaited_once()
     assert result["consensus"] is False
     assert result["approval_rate"] < 0.8
+    assert result["reasons"] == ["High risk"]
+
+
+@pytest.mark.asyncio
+async def test_propose_action_vote_timeout():
+    """Test a peer slower than the config timeout counts as a rejection."""
+    agents = [
+        SwarmAgent(SwarmConfig(role="proposer", timeout=0.01)),
+        SwarmAgent(SwarmConfig(role="slow_peer"))
+    ]
+    await asyncio.gather(*(agent.initialize() for agent in agents))
+    await agents[0].join_swarm([agents[1]])
+    
+    async def slow_vote(proposal):
+        await asyncio.sleep(1.0)
+        return {"decision": "approve", "confidence": 0.9, "reasoning": "Too late"}
+    
+    with patch.object(agents[1], 'evaluate_proposal', side_effect=slow_vote):
+        result = await agents[0].propose_action("trade", {"amount": 1})
+    
+    assert result["consensus"] is False
+    assert result["votes"][0]["decision"] == "reject"
+    assert "timed out" in result["reasons"][0]
 
 
 @pytest.mark.asyncio
@@ -262,6 +282,9 @@ def test_swarm_config_validation():
     with pytest.raises(ValueError):
         SwarmConfig(role="test", min_votes=0)
     
+    # Unbounded votes
+    assert SwarmConfig(role="test", timeout=None).timeout is None
+    
     # Invalid timeout
     with pytest.raises(ValueError):
         SwarmConfig(role="test", timeout=-1)
\ No newline at end of file
@@ -9,20 +9,24 @@ async def test_all_dexs():
         # Test each DEX
         dexs = ['jupiter', 'raydium', 'orca']
         
-        for dex_name in dexs:
-            try:
-                print(f"\n🔄 Testing {dex_name.title()}...")
-                
-                dex_data = await market.get_dex_data(dex_name)
-                
-                print(f"📊 {dex_name.title()} Stats:")
-                print(f"   TVL: ${dex_data.tvl:,.0f}")
-                print(f"   Volume 24h: ${dex_data.volume_24h:,.0f}")
-                print(f"   Pools: {dex_data.pools_count}")
-                print(f"✅ {dex_name.title()} test passed!")
-                
-            except Exception as e:
-                print(f"❌ {dex_name.title()} test failed: {e}")
+        # Fetch all DEXs concurrently; failures come back in place
+        results = await asyncio.gather(
+            *(market.get_dex_data(dex_name) for dex_name in dexs),
+            return_exceptions=True
+        )
+        
+        for dex_name, dex_data in zip(dexs, results):
+            print(f"\n🔄 Testing {dex_name.title()}...")
+            
+            if isinstance(dex_data, Exception):
+                print(f"❌ {dex_name.title()} test failed: {dex_data}")
+                continue
+            
+            print(f"📊 {dex_name.title()} Stats:")
+            print(f"   TVL: ${dex_data.tvl:,.0f}")
+            print(f"   Volume 24h: ${dex_data.volume_24h:,.0f}")
+            print(f"   Pools: {dex_data.pools_count}")
+            print(f"✅ {dex_name.title()} test passed!")
 
 if __name__ == "__main__":
     asyncio.run(test_all_dexs())
\ No newline at end of file
@@ -19,21 +19,29 @@ async def full_integration_test():
         balance = await solana.get_balance()
         print(f"   Wallet Balance: {balance} SOL ✅")
     
-    # Test 2: Market Data
-    print("\n2️⃣ Testing Market Data...")
+    # Tests 2 and 3 share one market session and run concurrently
     async with MarketDataManager() as market:
-        sol_price = await market.get_token_price('sol')
-        print(f"   SOL Price: ${sol_price['price']:.2f} ✅")
-    
-    # Test 3: DEX Data
-    print("\n3️⃣ Testing DEX Integration...")
-    async with MarketDataManager() as market:
-        for dex in ['jupiter', 'raydium']:
-            try:
-                dex_data = await market.get_dex_data(dex)
+        dexs = ['jupiter', 'raydium']
+        sol_price, *results = await asyncio.gather(
+            market.get_token_price('sol'),
+            *(market.get_dex_data(dex) for dex in dexs),
+            return_exceptions=True
+        )
+        
+        # Test 2: Market Data
+        print("\n2️⃣ Testing Market Data...")
+        if isinstance(sol_price, Exception):
+            print(f"   SOL Price: ❌ {sol_price}")
+        else:
+            print(f"   SOL Price: ${sol_price['price']:.2f} ✅")
+        
+        # Test 3: DEX Data
+        print("\n3️⃣ Testing DEX Integration...")
+        for dex, dex_data in zip(dexs, results):
+            if isinstance(dex_data, Exception):
+                print(f"   {dex.title()}: ⚠️ {dex_data}")
+            else:
                 print(f"   {dex.title()} TVL: ${dex_data.tvl:,.0f} ✅")
-            except Exception as e:
-                print(f"   {dex.title()}: ⚠️ {e}")
     
     # Test 4: Agent Loading
     print("\n4️⃣ Testing Agent System...")
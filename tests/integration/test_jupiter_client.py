@@ -0,0 +1,135 @@
+"""
+Offline tests for the Jupiter client quote and token list paths
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from solana_swarm.core.exceptions import JupiterError
+from solana_swarm.integrations.jupiter import JupiterClient, JupiterQuote
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+RAY_MINT = "4k3Dyjzvzp8eMZWUXbBCjEvwSkkk59S5iCNLY3QrkX6R"
+
+
+class _FakeResponse:
+    """Fake aiohttp response usable as an async context manager."""
+
+    def __init__(self, body, status=200):
+        self.body = body
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    async def read(self):
+        return self.body
+
+
+def _client_with_responses(*responses):
+    """Client whose session returns the given responses in order."""
+    client = JupiterClient()
+    session = MagicMock()
+    session.closed = False
+    session.get.side_effect = list(responses)
+    client.session = session
+    return client, session
+
+
+def _quote(input_mint, output_mint, amount):
+    """Quote as parsed from the Jupiter /quote endpoint."""
+    return JupiterQuote(
+        input_mint=input_mint,
+        in_amount=amount,
+        output_mint=output_mint,
+        out_amount=amount * 2,
+        other_amount_threshold=amount * 2,
+        swap_mode="ExactIn",
+        slippage_bps=50,
+        platform_fee=None,
+        price_impact_pct="0",
+        route_plan=[],
+        context_slot=1,
+        time_taken=0.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_quotes_batch_keeps_order_and_isolates_failures():
+    """Test a failing pair is returned in its slot without cancelling the others."""
+    client = JupiterClient()
+    completed = []
+
+    async def fake_get_quote(input_mint, output_mint, amount, slippage_bps=50):
+        if output_mint == RAY_MINT:
+            raise JupiterError("Quote failed: no route")
+        # Finish in reverse request order, after the failure has been raised
+        await asyncio.sleep(0.01 if input_mint == SOL_MINT else 0.005)
+        completed.append(input_mint)
+        return _quote(input_mint, output_mint, amount)
+
+    requests = [
+        {"input_mint": SOL_MINT, "output_mint": USDC_MINT, "amount": 1000},
+        {"input_mint": SOL_MINT, "output_mint": RAY_MINT, "amount": 2000},
+        {"input_mint": USDC_MINT, "output_mint": SOL_MINT, "amount": 3000}
+    ]
+
+    with patch.object(client, "_ensure_session", AsyncMock()), \
+            patch.object(client, "get_quote", side_effect=fake_get_quote) as mock_get_quote:
+        results = await client.get_quotes_batch(requests)
+
+    assert mock_get_quote.call_count == 3
+    assert completed == [USDC_MINT, SOL_MINT]
+
+    first, failed, last = results
+    assert isinstance(first, JupiterQuote)
+    assert (first.input_mint, first.output_mint, first.in_amount) == (SOL_MINT, USDC_MINT, 1000)
+    assert isinstance(failed, JupiterError)
+    assert "no route" in str(failed)
+    assert isinstance(last, JupiterQuote)
+    assert (last.input_mint, last.output_mint, last.in_amount) == (USDC_MINT, SOL_MINT, 3000)
+
+
+@pytest.mark.asyncio
+async def test_get_quotes_batch_wraps_unexpected_errors():
+    """Test a non-Jupiter failure in one pair comes back as a JupiterError."""
+    client = JupiterClient()
+
+    with patch.object(client, "_ensure_session", AsyncMock()), \
+            patch.object(client, "get_quote", side_effect=ValueError("bad payload")):
+        results = await client.get_quotes_batch([
+            {"input_mint": SOL_MINT, "output_mint": USDC_MINT, "amount": 1000}
+        ])
+
+    assert len(results) == 1
+    assert isinstance(results[0], JupiterError)
+    assert "bad payload" in str(results[0])
+
+
+@pytest.mark.asyncio
+async def test_get_quote_retries_then_rejects_malformed_json():
+    """Test an unparseable quote body is retried and surfaces as a JupiterError."""
+    client, session = _client_with_responses(_FakeResponse(b"<html>"), _FakeResponse(b"{"))
+
+    with patch("solana_swarm.integrations.jupiter.client.asyncio.sleep", AsyncMock()):
+        with pytest.raises(JupiterError, match="Invalid quote response"):
+            await client.get_quote(SOL_MINT, USDC_MINT, 1000, max_retries=2)
+
+    assert session.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_supported_tokens_falls_back_on_malformed_json():
+    """Test an unparseable token list is retried, then the minimal list is used."""
+    client, session = _client_with_responses(_FakeResponse(b"not json"), _FakeResponse(b"[1,"))
+
+    with patch("solana_swarm.integrations.jupiter.client.asyncio.sleep", AsyncMock()):
+        tokens = await client.get_supported_tokens(max_retries=2)
+
+    assert session.get.call_count == 2
+    assert tokens == client._get_minimal_token_list()
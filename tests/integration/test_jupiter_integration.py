@@ -34,6 +34,18 @@ async def test_jupiter():
         
         print(f"📊 Quote - In: {quote.in_amount}, Out: {quote.out_amount}")
         print(f"🎯 Price Impact: {quote.price_impact_pct}%")
+        
+        # Test batched quotes (both directions in one fan-out)
+        quotes = await client.get_quotes_batch([
+            {"input_mint": sol_mint, "output_mint": usdc_mint, "amount": 1000000000},
+            {"input_mint": usdc_mint, "output_mint": sol_mint, "amount": 100000000},
+        ])
+        
+        for batch_quote in quotes:
+            if isinstance(batch_quote, Exception):
+                print(f"⚠️ Batch quote failed: {batch_quote}")
+            else:
+                print(f"📦 Batch Quote - In: {batch_quote.in_amount}, Out: {batch_quote.out_amount}")
         print("✅ Jupiter test passed!")
         
     except Exception as e:
@@ -0,0 +1,207 @@
+"""
+Offline tests for the Raydium client quote path, pool cache and retries
+"""
+
+import asyncio
+import orjson
+import pytest
+from unittest.mock import MagicMock
+
+from solana_swarm.core.exceptions import RaydiumError
+from solana_swarm.integrations._amm_math import cpmm_out
+from solana_swarm.integrations.raydium import RaydiumClient, RaydiumPool
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+RAY_MINT = "4k3Dyjzvzp8eMZWUXbBCjEvwSkkk59S5iCNLY3QrkX6R"
+
+
+def _pool_data(pool_id, base_reserve, quote_reserve, base_mint=SOL_MINT, quote_mint=USDC_MINT):
+    """Raw pool row as returned by the Raydium pairs/pool endpoints."""
+    return {
+        "id": pool_id,
+        "baseMint": base_mint,
+        "quoteMint": quote_mint,
+        "lpMint": f"lp_{pool_id}",
+        "baseDecimals": 9,
+        "quoteDecimals": 6,
+        "lpDecimals": 9,
+        "baseReserve": str(base_reserve),
+        "quoteReserve": str(quote_reserve),
+        "lpSupply": "1000",
+        "liquidity": float(quote_reserve),
+        "volume24h": 0
+    }
+
+
+class _FakeResponse:
+    """Fake aiohttp response usable as an async context manager."""
+
+    def __init__(self, payload, status=200, delay=0.0):
+        self.payload = payload
+        self.status = status
+        self.delay = delay
+
+    async def __aenter__(self):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    async def read(self):
+        return orjson.dumps(self.payload)
+
+    async def json(self, loads=None):
+        return self.payload
+
+
+def _client_with_responses(*responses):
+    """Client whose session returns (or raises) the given responses in order."""
+    client = RaydiumClient(shared_session=False)
+    session = MagicMock()
+    session.closed = False
+    session.get.side_effect = list(responses)
+    client.session = session
+    return client, session
+
+
+def test_quote_pool_constant_product():
+    """Test a base-for-quote quote against known reserves."""
+    client = RaydiumClient(shared_session=False)
+    pool = RaydiumPool.from_dict(_pool_data("pool", base_reserve=1000, quote_reserve=2000))
+
+    quote = client._quote_pool(pool, SOL_MINT, 1000, slippage_bps=50)
+
+    # 2000 * 1000 / (1000 + 1000) = 1000 out before the 0.25% fee
+    assert quote["fee"] == 2
+    assert quote["amount_out"] == 998
+    assert quote["min_amount_out"] == 998 * 9950 // 10000
+    assert quote["route"] == ["pool"]
+    assert quote["price_impact"] == quote["price_impact_bps"] / 100.0
+
+
+def test_cpmm_out_floors_output():
+    """Test the output rounds down, never in the trader's favour."""
+    # Exact output is 1000 * 10 / 1010 = 9.9
+    assert cpmm_out(1000, 1000, 10, 0) == (9, 0)
+
+
+def test_pool_from_dict_accepts_decimal_reserves():
+    """Test decimal-string reserves are truncated to whole raw units."""
+    pool = RaydiumPool.from_dict(_pool_data("pool", base_reserve="123.5", quote_reserve="2000.0"))
+
+    assert pool.base_reserve == 123
+    assert pool.quote_reserve == 2000
+
+
+def test_pool_base_price_is_read_only():
+    """Test the precomputed spot price is exposed but cannot be reassigned."""
+    pool = RaydiumPool.from_dict(_pool_data("pool", base_reserve=1000, quote_reserve=2000))
+    empty = RaydiumPool.from_dict(_pool_data("empty", base_reserve=0, quote_reserve=2000))
+
+    assert pool.base_price == 2.0
+    assert empty.base_price == 0.0
+    with pytest.raises(AttributeError):
+        pool.base_price = 3.0
+
+
+@pytest.mark.asyncio
+async def test_malformed_pool_rows_are_skipped():
+    """Test one bad row does not fail the whole pool list."""
+    missing_id = _pool_data("missing", base_reserve=1000, quote_reserve=2000)
+    del missing_id["id"]
+    pools = [
+        _pool_data("good", base_reserve=1000, quote_reserve=2000),
+        _pool_data("bad", base_reserve="not-a-number", quote_reserve=2000),
+        missing_id
+    ]
+    client, session = _client_with_responses(_FakeResponse(pools))
+
+    result = await client.get_pools()
+
+    assert [pool.id for pool in result] == ["good"]
+
+
+@pytest.mark.asyncio
+async def test_get_quote_uses_one_pool_list_fetch():
+    """Test quotes pick the best pool and reuse the cached pool list."""
+    pools = [
+        _pool_data("shallow", base_reserve=1000, quote_reserve=2000),
+        _pool_data("deep", base_reserve=1000000, quote_reserve=2000000),
+        _pool_data("other", base_reserve=1000, quote_reserve=1000, quote_mint=RAY_MINT)
+    ]
+    client, session = _client_with_responses(_FakeResponse(pools))
+
+    first = await client.get_quote(SOL_MINT, USDC_MINT, 1000)
+    second = await client.get_quote(USDC_MINT, SOL_MINT, 1000)
+
+    assert first["pool_id"] == "deep"
+    assert second["pool_id"] == "deep"
+    assert session.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_list_refetched_after_ttl():
+    """Test the pool list is fetched again once its TTL has passed."""
+    pools = [_pool_data("pool", base_reserve=1000, quote_reserve=2000)]
+    client, session = _client_with_responses(_FakeResponse(pools), _FakeResponse(pools))
+
+    await client.get_pools()
+    client._cache_timestamp -= RaydiumClient.POOLS_CACHE_TTL + 1
+    await client.get_pools()
+
+    assert session.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pool_list_misses_share_one_fetch():
+    """Test concurrent cache misses wait for a single pool list download."""
+    pools = [_pool_data("pool", base_reserve=1000, quote_reserve=2000)]
+    client, session = _client_with_responses(_FakeResponse(pools, delay=0.01))
+
+    results = await asyncio.gather(*(client.get_pools() for _ in range(3)))
+
+    assert session.get.call_count == 1
+    assert all(len(result) == 1 for result in results)
+
+
+@pytest.mark.asyncio
+async def test_get_pool_info_retries_timeout():
+    """Test a single pool lookup is retried once after a timeout."""
+    client, session = _client_with_responses(
+        asyncio.TimeoutError(),
+        _FakeResponse(_pool_data("pool", base_reserve=1000, quote_reserve=2000))
+    )
+
+    pool = await client.get_pool_info("pool")
+
+    assert pool.id == "pool"
+    assert session.get.call_count == RaydiumClient.POOL_INFO_RETRIES + 1
+
+
+@pytest.mark.asyncio
+async def test_get_pool_info_gives_up_after_retries():
+    """Test repeated timeouts surface as a RaydiumError."""
+    client, session = _client_with_responses(
+        *(asyncio.TimeoutError() for _ in range(RaydiumClient.POOL_INFO_RETRIES + 1))
+    )
+
+    with pytest.raises(RaydiumError):
+        await client.get_pool_info("pool")
+
+    assert session.get.call_count == RaydiumClient.POOL_INFO_RETRIES + 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shared_session", [True, False])
+async def test_session_has_default_timeout(shared_session):
+    """Test both session flavours fall back to the client's session timeout."""
+    client = RaydiumClient(shared_session=shared_session)
+
+    await client._create_session()
+    try:
+        assert client.session.timeout is RaydiumClient.SESSION_TIMEOUT
+    finally:
+        await client.close()
@@ -4,48 +4,78 @@ Integration tests for Solana Swarm components
 
 import pytest
 import os
-from unittest.mock import AsyncMock, patch
+from collections import Counter
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from solana_swarm.core.swarm_agent import SwarmAgent, SwarmConfig
-from solana_swarm.core.market_data import MarketDataManager
+from solana_swarm.core.market_data import MarketDataManager, PriceData, DataSource
 from solana_swarm.plugins.loader import PluginLoader
 from solana_swarm.core.llm_provider import LLMConfig
+import aiohttp
 import asyncio
+import gc
+
+
+class MockPlugin:
+    """Minimal plugin returned by the mocked plugin module."""
+
+    def __init__(self, agent_config, plugin_config):
+        self.agent_config = agent_config
+        self.plugin_config = plugin_config
+        self._is_initialized = False
+    
+    async def initialize(self):
+        self._is_initialized = True
+    
+    async def evaluate(self, context):
+        return {"result": "test"}
+    
+    async def execute(self, operation=None, **kwargs):
+        return {"status": "success"}
+    
+    async def cleanup(self):
+        self._is_initialized = False
+
+
+@pytest.fixture
+def make_config():
+    """Factory for LLM-backed swarm configs; keyword overrides go to SwarmConfig."""
+    def _make_config(role, api_key="test", **overrides):
+        llm = LLMConfig(provider="openrouter", api_key=api_key, model="test")
+        return SwarmConfig(role=role, llm=llm, **overrides)
+    return _make_config
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_full_swarm_workflow():
+async def test_full_swarm_workflow(make_config):
     """Test complete swarm workflow with multiple agents."""
     # Create swarm configuration
     configs = [
-        SwarmConfig(
-            role="market_analyzer",
-            min_confidence=0.7,
-            llm=LLMConfig(provider="openrouter", api_key="test", model="test")
-        ),
-        SwarmConfig(
-            role="risk_manager", 
-            min_confidence=0.8,
-            llm=LLMConfig(provider="openrouter", api_key="test", model="test")
-        )
+        make_config("market_analyzer"),
+        make_config("risk_manager", min_confidence=0.8)
     ]
     
     agents = []
+    mock_llms = []
     
     try:
         # Initialize agents
         for config in configs:
             agent = SwarmAgent(config)
             
-            # Mock LLM provider
-            with patch('solana_swarm.core.llm_provider.create_llm_provider') as mock_create:
+            # Mock LLM provider where SwarmAgent looks it up
+            with patch('solana_swarm.core.swarm_agent.create_llm_provider') as mock_create:
                 mock_llm = AsyncMock()
                 mock_llm.query.return_value = '{"decision": "approve", "confidence": 0.85, "reasoning": "Integration test"}'
                 mock_create.return_value = mock_llm
                 
                 await agent.initialize()
                 agents.append(agent)
+                mock_llms.append(mock_llm)
         
         # Form swarm
         await agents[0].join_swarm(agents[1:])
@@ -71,12 +101,20 @@ async def test_full_swarm_workflow():
             
             assert "consensus" in result
             assert "approval_rate" in result
-            assert result["total_votes"] >= 1
+            # Every peer votes concurrently; the proposer does not vote
+            assert result["total_votes"] == len(agents) - 1
+            
+            # The mocked 0.85-confidence answer clears the peer's 0.8 bar
+            mock_llms[1].query.assert_awaited_once()
+            mock_llms[0].query.assert_not_awaited()
+            assert [vote["decision"] for vote in result["votes"]] == ["approve"]
+            assert result["approval_rate"] == 1.0
     
     finally:
-        # Cleanup
-        for agent in agents:
-            await agent.cleanup()
+        # Cleanup every agent, even if one of them fails
+        results = await asyncio.gather(*(agent.cleanup() for agent in agents), return_exceptions=True)
+        errors = [r for r in results if isinstance(r, Exception)]
+        assert not errors, errors
 
 
 @pytest.mark.integration
@@ -91,27 +129,8 @@ async def test_plugin_loader_integration():
             mock_exists.return_value = True
             
             with patch('importlib.util.spec_from_file_location') as mock_spec:
-                # Mock plugin class
-                class MockPlugin:
-                    def __init__(self, agent_config, plugin_config):
-                        self.agent_config = agent_config
-                        self.plugin_config = plugin_config
-                        self._is_initialized = False
-                    
-                    async def initialize(self):
-                        self._is_initialized = True
-                    
-                    async def evaluate(self, context):
-                        return {"result": "test"}
-                    
-                    async def execute(self, operation=None, **kwargs):
-                        return {"status": "success"}
-                    
-                    async def cleanup(self):
-                        self._is_initialized = False
-                
                 # Mock module
-                mock_module = type('MockModule', (), {'MockPlugin': MockPlugin})
+                mock_module = SimpleNamespace(MockPlugin=MockPlugin)
                 
                 mock_spec_instance = AsyncMock()
                 mock_spec_instance.loader.exec_module = lambda m: setattr(m, 'MockPlugin', MockPlugin)
@@ -133,58 +152,222 @@ async def test_plugin_loader_integration():
 @pytest.mark.integration
 @pytest.mark.asyncio 
 async def test_market_data_integration():
-    """Test market data integration with fallback sources."""
-    market_manager = MarketDataManager()
+    """Test price and DEX fetches parse API payloads over the one session."""
+    market_manager = MarketDataManager(enable_ccxt=False)
+    payloads = {
+        "https://hermes.pyth.network/api/latest_price_feeds": [
+            {"price": {"price": "10000000000", "expo": -8, "publish_time": 1700000000}}
+        ],
+        "https://api.raydium.io/v2/main/info": {
+            "tvl": 1000000,
+            "volume24h": 50000,
+            "volume7d": 300000,
+            "fees24h": 125,
+            "poolsCount": 42
+        }
+    }
+    
+    def fake_get(url, *args, **kwargs):
+        response = AsyncMock()
+        response.status = 200
+        response.json.return_value = payloads[url]
+        context = MagicMock()
+        context.__aenter__.return_value = response
+        return context
+    
+    session_init = aiohttp.ClientSession.__init__
     
     try:
-        await market_manager.initialize()
-        
-        # Test with mocked external APIs
-        with patch('aiohttp.ClientSession.get') as mock_get:
-            # Mock CoinGecko response
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.json.return_value = {
-                "market_data": {
-                    "current_price": {"usd": 100.0},
-                    "total_volume": {"usd": 1000000},
-                    "price_change_percentage_24h": 5.0,
-                    "market_cap": {"usd": 50000000}
-                }
-            }
-            mock_get.return_value.__aenter__.return_value = mock_response
+        # Every endpoint is fetched through aiohttp; count the sessions opened on the way
+        with patch.object(aiohttp.ClientSession, '__init__', autospec=True, side_effect=session_init) as mock_init, \
+                patch('aiohttp.ClientSession.get', side_effect=fake_get) as mock_get:
+            price_data = await market_manager.get_token_price("SOL", sources=[DataSource.PYTH])
+            session = market_manager.session
+            dex_data = await market_manager.get_dex_data("raydium")
             
-            # Test price fetching
+            # Drop the cached price so the second lookup goes back to the network
+            market_manager.cache.clear()
+            second_price = await market_manager.get_token_price("SOL", sources=[DataSource.PYTH])
+        
+        assert {"symbol", "price", "volume_24h", "source", "timestamp"} <= price_data.keys()
+        assert price_data["symbol"] == "SOL"
+        assert price_data["price"] == 100.0
+        assert price_data["source"] == DataSource.PYTH.value
+        assert second_price["price"] == 100.0
+        assert dex_data.pools_count == 42
+        assert mock_get.call_count == 3
+        
+        # One session, opened on first use and reused by every later fetch
+        assert mock_init.call_count == 1
+        assert market_manager.session is session
+        assert session.connector is market_manager._shared_connector
+    
+    finally:
+        await market_manager.close()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_market_data_price_single_flight():
+    """Test concurrent price requests for one token share a single fetch."""
+    market_manager = MarketDataManager(enable_ccxt=False)
+    
+    async def slow_source(symbol, source):
+        await asyncio.sleep(0.01)
+        return PriceData(
+            symbol=symbol,
+            price=Decimal("100"),
+            volume_24h=Decimal("1000000"),
+            change_24h=5.0,
+            market_cap=None,
+            timestamp=datetime.now(),
+            source=source
+        )
+    
+    try:
+        with patch.object(market_manager, '_get_price_from_source', side_effect=slow_source) as mock_source:
+            results = await asyncio.gather(
+                *(market_manager.get_token_price("SOL") for _ in range(3))
+            )
+            cached = await market_manager.get_token_price("sol")
+        
+        # Three concurrent misses plus a cache hit cost one call per raced source
+        called = Counter(call.args[1] for call in mock_source.call_args_list)
+        assert called == Counter([DataSource.JUPITER, DataSource.COINGECKO, DataSource.BINANCE])
+        assert all(result["price"] == 100.0 for result in results)
+        assert cached is results[0]
+    
+    finally:
+        await market_manager.close()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_market_data_price_single_flight_respects_sources():
+    """Test a concurrent request for other sources is not served by an in-flight fetch."""
+    market_manager = MarketDataManager(enable_ccxt=False)
+    
+    async def slow_source(symbol, source):
+        await asyncio.sleep(0.01)
+        return PriceData(
+            symbol=symbol,
+            price=Decimal("100"),
+            volume_24h=Decimal("1000000"),
+            change_24h=5.0,
+            market_cap=None,
+            timestamp=datetime.now(),
+            source=source
+        )
+    
+    try:
+        with patch.object(market_manager, '_get_price_from_source', side_effect=slow_source) as mock_source:
+            default, pyth = await asyncio.gather(
+                market_manager.get_token_price("SOL"),
+                market_manager.get_token_price("SOL", sources=[DataSource.PYTH])
+            )
+        
+        # Each source list ran its own fetch
+        called = Counter(call.args[1] for call in mock_source.call_args_list)
+        assert called == Counter([DataSource.JUPITER, DataSource.COINGECKO, DataSource.BINANCE, DataSource.PYTH])
+        assert default["source"] in {DataSource.JUPITER.value, DataSource.COINGECKO.value, DataSource.BINANCE.value}
+        assert pyth["source"] == DataSource.PYTH.value
+    
+    finally:
+        await market_manager.close()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_market_data_price_races_sources():
+    """Test the fastest price source wins and slower sources are cancelled."""
+    market_manager = MarketDataManager(enable_ccxt=False)
+    delays = {DataSource.JUPITER: 10.0, DataSource.COINGECKO: 0.0, DataSource.BINANCE: 10.0}
+    
+    async def timed_source(symbol, source):
+        await asyncio.sleep(delays[source])
+        return PriceData(
+            symbol=symbol,
+            price=Decimal("100"),
+            volume_24h=Decimal("1000000"),
+            change_24h=5.0,
+            market_cap=None,
+            timestamp=datetime.now(),
+            source=source
+        )
+    
+    try:
+        with patch.object(market_manager, '_get_price_from_source', side_effect=timed_source) as mock_source:
+            price_data = await asyncio.wait_for(market_manager.get_token_price("SOL"), 1.0)
+        
+        # All sources were queried, and the fast one answered without waiting on the others
+        assert mock_source.call_count == 3
+        assert price_data["source"] == DataSource.COINGECKO.value
+    
+    finally:
+        await market_manager.close()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_market_data_price_race_cleans_up_losers():
+    """Test losing sources are cancelled and their failures retrieved before returning."""
+    market_manager = MarketDataManager(enable_ccxt=False)
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    cancelled = set()
+    
+    async def racing_source(symbol, source):
+        if source == DataSource.COINGECKO:
+            raise RuntimeError("coingecko down")
+        if source == DataSource.BINANCE:
+            try:
+                await asyncio.sleep(10.0)
+            except asyncio.CancelledError:
+                cancelled.add(source)
+                raise
+        return PriceData(
+            symbol=symbol,
+            price=Decimal("100"),
+            volume_24h=Decimal("1000000"),
+            change_24h=5.0,
+            market_cap=None,
+            timestamp=datetime.now(),
+            source=source
+        )
+    
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+    try:
+        with patch.object(market_manager, '_get_price_from_source', side_effect=racing_source):
             price_data = await market_manager.get_token_price("SOL")
-            
-            assert price_data.symbol == "SOL"
-            assert price_data.price > 0
-            assert price_data.source.value in ["coingecko", "jupiter", "binance"]
+        
+        # The slow source was cancelled and awaited before the price came back
+        assert price_data["source"] == DataSource.JUPITER.value
+        assert cancelled == {DataSource.BINANCE}
+        
+        # The failing source finished alongside the winner but its error was still retrieved
+        gc.collect()
+        assert unhandled == []
     
     finally:
+        loop.set_exception_handler(None)
         await market_manager.close()
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_error_recovery():
+async def test_error_recovery(make_config):
     """Test system error recovery and fallback mechanisms."""
-    config = SwarmConfig(
-        role="test_agent",
-        llm=LLMConfig(provider="openrouter", api_key="invalid", model="test")
-    )
+    config = make_config("test_agent", api_key="invalid")
     
     agent = SwarmAgent(config)
     
     # Test initialization with invalid LLM config
-    with patch('solana_swarm.core.llm_provider.create_llm_provider') as mock_create:
-        mock_create.side_effect = Exception("LLM initialization failed")
-        
-        # Should handle initialization error gracefully
-        try:
+    with patch(
+        'solana_swarm.core.swarm_agent.create_llm_provider',
+        side_effect=Exception("LLM initialization failed")
+    ):
+        with pytest.raises(Exception, match="LLM initialization failed"):
             await agent.initialize()
-        except Exception as e:
-            assert "LLM initialization failed" in str(e)
     
     # Test evaluation with network errors
     agent._initialized = True
@@ -208,17 +391,11 @@ async def test_concurrent_agent_operations():
     import asyncio
     
     configs = [SwarmConfig(role=f"agent_{i}") for i in range(3)]
-    agents = []
+    agents = [SwarmAgent(config) for config in configs]
     
     try:
         # Initialize agents concurrently
-        init_tasks = []
-        for config in configs:
-            agent = SwarmAgent(config)
-            init_tasks.append(agent.initialize())
-            agents.append(agent)
-        
-        await asyncio.gather(*init_tasks)
+        await asyncio.gather(*(agent.initialize() for agent in agents))
         
         # Form swarm network
         await agents[0].join_swarm(agents[1:])
@@ -233,12 +410,10 @@ async def test_concurrent_agent_operations():
                 "reasoning": "Concurrent test"
             }
             
-            eval_tasks = [
+            results = await asyncio.gather(*(
                 agent.evaluate_proposal({"type": "test", "data": ctx})
                 for agent, ctx in zip(agents, contexts)
-            ]
-            
-            results = await asyncio.gather(*eval_tasks)
+            ))
             
             assert len(results) == 3
             for result in results:
@@ -246,8 +421,9 @@ async def test_concurrent_agent_operations():
                 assert "confidence" in result
     
     finally:
-        cleanup_tasks = [agent.cleanup() for agent in agents]
-        await asyncio.gather(*cleanup_tasks)
+        results = await asyncio.gather(*(agent.cleanup() for agent in agents), return_exceptions=True)
+        errors = [r for r in results if isinstance(r, Exception)]
+        assert not errors, errors
 
 
 @pytest.mark.integration
@@ -261,11 +437,11 @@ async def test_long_running_swarm():
     try:
         await agent.initialize()
         
-        # Simulate long-running operations
-        for i in range(10):
-            context = {"iteration": i, "timestamp": i * 1000}
-            
-            with patch.object(agent, 'evaluate') as mock_eval:
+        # Simulate long-running operations under a single patch
+        with patch.object(agent, 'evaluate') as mock_eval:
+            for i in range(10):
+                context = {"iteration": i, "timestamp": i * 1000}
+                
                 mock_eval.return_value = {
                     "decision": "approve" if i % 2 == 0 else "reject",
                     "confidence": 0.7 + (i * 0.01),
@@ -278,10 +454,10 @@ async def test_long_running_swarm():
                 })
                 
                 assert "decision" in result
-                assert result["confidence"] > 0.7
-            
-            # Small delay to simulate real-world timing
-            await asyncio.sleep(0.01)
+                assert result["confidence"] == pytest.approx(0.7 + i * 0.01)
+                
+                # Yield to the event loop between iterations
+                await asyncio.sleep(0)
         
         # Verify agent is still responsive
         assert agent._is_running
@@ -0,0 +1,90 @@
+"""
+Benchmarks for Jupiter client hot paths (pytest-benchmark)
+"""
+
+import asyncio
+import os
+
+import orjson
+import pytest
+
+from solana_swarm.integrations.jupiter.client import JupiterClient
+from solana_swarm.integrations.jupiter.types import JupiterQuote
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+
+@pytest.fixture
+def quote_body():
+    """Raw /quote response body with a multi-hop route plan."""
+    route_plan = [
+        {
+            "swapInfo": {
+                "ammKey": f"amm{i}",
+                "label": "Raydium",
+                "inputMint": SOL_MINT,
+                "outputMint": USDC_MINT,
+                "inAmount": "1000000000",
+                "outAmount": "150000000",
+                "feeAmount": "25000",
+                "feeMint": USDC_MINT
+            },
+            "percent": 100
+        }
+        for i in range(4)
+    ]
+    return orjson.dumps({
+        "inputMint": SOL_MINT,
+        "inAmount": "1000000000",
+        "outputMint": USDC_MINT,
+        "outAmount": "150000000",
+        "otherAmountThreshold": "149250000",
+        "swapMode": "ExactIn",
+        "slippageBps": 50,
+        "platformFee": None,
+        "priceImpactPct": "0.0001",
+        "routePlan": route_plan,
+        "contextSlot": 123456789,
+        "timeTaken": 0.01
+    })
+
+
+@pytest.mark.benchmark(group="jupiter-parse")
+def test_quote_parse_benchmark(benchmark, quote_body):
+    """Benchmark decoding a raw quote body into a JupiterQuote."""
+    quote = benchmark(lambda: JupiterQuote.from_dict(orjson.loads(quote_body)))
+
+    assert quote.in_amount == 1000000000
+    assert quote.out_amount == 150000000
+    assert len(quote.route_plan) == 4
+
+
+@pytest.mark.live
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not os.getenv("RUN_LIVE_BENCH"),
+    reason="live Jupiter benchmark; set RUN_LIVE_BENCH=1 to run"
+)
+@pytest.mark.benchmark(group="jupiter-live")
+def test_get_quote_benchmark(benchmark):
+    """Benchmark live get_quote round-trips over one keep-alive session."""
+    loop = asyncio.new_event_loop()
+    client = JupiterClient()
+
+    try:
+        quote = benchmark.pedantic(
+            lambda: loop.run_until_complete(
+                client.get_quote(SOL_MINT, USDC_MINT, 1000000000, 50)
+            ),
+            rounds=10,
+            iterations=1,
+            warmup_rounds=1
+        )
+
+        assert quote.out_amount > 0
+
+    finally:
+        # Also releases the shared connector created on this private loop
+        loop.run_until_complete(client.close())
+        loop.close()
@@ -55,4 +55,10 @@ async def test_agents():
         await loader.cleanup()
 
 if __name__ == "__main__":
-    asyncio.run(test_agents())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop unavailable (not installed or unsupported platform); fall back to asyncio.run
+        asyncio.run(test_agents())
+    else:
+        uvloop.run(test_agents())
\ No newline at end of file
@@ -3,6 +3,9 @@ import asyncio
 from solana_swarm.core.swarm_agent import SwarmAgent, SwarmConfig
 from solana_swarm.core.llm_provider import LLMConfig
 import os
+
+ROLES = ('market_analyzer', 'risk_manager', 'strategy_optimizer')
+
 async def test_swarm():
     """Test agent swarm functionality"""
     print("🐝 Testing Agent Swarm...")
@@ -15,19 +18,15 @@ async def test_swarm():
     )
     
     # Create agents
-    agents = []
-    roles = ['market_analyzer', 'risk_manager', 'strategy_optimizer']
+    agents = [
+        SwarmAgent(SwarmConfig(role=role, min_confidence=0.7, llm=llm_config))
+        for role in ROLES
+    ]
     
     try:
-        for role in roles:
-            config = SwarmConfig(
-                role=role,
-                min_confidence=0.7,
-                llm=llm_config
-            )
-            agent = SwarmAgent(config)
-            await agent.initialize()
-            agents.append(agent)
+        # Initialize all agents concurrently
+        await asyncio.gather(*(agent.initialize() for agent in agents))
+        for role in ROLES:
             print(f"✅ Created {role} agent")
         
         # Form swarm
@@ -51,8 +50,16 @@ async def test_swarm():
     except Exception as e:
         print(f"❌ Swarm test failed: {e}")
     finally:
-        for agent in agents:
-            await agent.cleanup()
+        results = await asyncio.gather(*(agent.cleanup() for agent in agents), return_exceptions=True)
+        for role, error in zip(ROLES, results):
+            if isinstance(error, Exception):
+                print(f"❌ Cleanup failed for {role} agent: {error}")
 
 if __name__ == "__main__":
-    asyncio.run(test_swarm())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop unavailable (not installed or unsupported platform); fall back to asyncio.run
+        asyncio.run(test_swarm())
+    else:
+        uvloop.run(test_swarm())
\ No newline at end of file